@@ -0,0 +1,78 @@
+# Benchmark pitch_movement & delta_win_exp analyses (row-wise apply vs. vectorized)
+# Usage (from repo root): python -m benchmarks.analysis [rows]
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+from mlb_videos.analysis import pitch_movement, delta_win_exp
+
+_ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+_APPLY_ROWS = min(_ROWS, 100_000)
+
+
+def synthetic_df(rows: int) -> pd.DataFrame:
+    """Synthetic statcast-like frame (nullable, as after convert_dtypes)"""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "pfx_x": rng.normal(0, 0.8, rows).round(2),
+            "pfx_z": rng.normal(0.8, 0.6, rows).round(2),
+            "inning_topbot": rng.choice(["Top", "Bot"], rows),
+            "delta_home_win_exp": rng.normal(0, 0.02, rows).round(3),
+        }
+    )
+    for col in ["pfx_x", "pfx_z"]:
+        df.loc[rng.random(rows) < 0.01, col] = np.nan
+    return df.convert_dtypes()
+
+
+def apply_pitch_movement(df: pd.DataFrame) -> pd.DataFrame:
+    """Row-wise implementation (calc_pitch_movement per row)"""
+    return df.apply(
+        lambda x: (
+            pitch_movement.calc_pitch_movement(x)
+            if not pd.isnull(x.pfx_x) and not pd.isnull(x.pfx_z)
+            else (0.00, 0.00, 0.00, 0.00)
+        ),
+        axis=1,
+        result_type="expand",
+    ).set_axis(pitch_movement._RETURN_COLS, axis=1)
+
+
+def apply_delta_win_exp(df: pd.DataFrame) -> pd.DataFrame:
+    """Row-wise implementation (calc_batter_pitcher_delta_win_exp per row)"""
+    return df.apply(
+        lambda x: delta_win_exp.calc_batter_pitcher_delta_win_exp(x),
+        axis=1,
+        result_type="expand",
+    ).set_axis(delta_win_exp._RETURN_COLS, axis=1)
+
+
+def timed(func, df: pd.DataFrame) -> tuple:
+    start = time.perf_counter()
+    result = func(df)
+    return result, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    df = synthetic_df(_ROWS)
+
+    for name, before_func, after_func in [
+        ("pitch_movement", apply_pitch_movement, pitch_movement.calc_pitch_movements),
+        (
+            "delta_win_exp",
+            apply_delta_win_exp,
+            delta_win_exp.calc_batter_pitcher_delta_win_exps,
+        ),
+    ]:
+        before, before_secs = timed(before_func, df.head(_APPLY_ROWS))
+        after, after_secs = timed(after_func, df)
+
+        pd.testing.assert_frame_equal(
+            before, after.head(_APPLY_ROWS), check_dtype=False, check_exact=True
+        )
+
+        print(f"{name}")
+        print(f"  apply (before):      {_APPLY_ROWS / before_secs:>14,.0f} rows/sec")
+        print(f"  vectorized (after):  {_ROWS / after_secs:>14,.0f} rows/sec")
@@ -0,0 +1,58 @@
+# Benchmark pitch_id construction (row-wise apply vs. vectorized)
+# Usage (from repo root): python -m benchmarks.pitch_id [rows]
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+from mlb_videos.statcast import (
+    _UNIQUE_IDENTIFIER_COLS,
+    _UNIQUE_IDENTIFIER_DELIMITER,
+    build_pitch_id,
+    build_pitch_key,
+)
+
+_ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+_APPLY_ROWS = min(_ROWS, 100_000)
+
+
+def synthetic_df(rows: int) -> pd.DataFrame:
+    """Synthetic statcast-like frame (nullable ints, as after convert_dtypes)"""
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "game_pk": rng.integers(700000, 750000, rows),
+            "at_bat_number": rng.integers(1, 80, rows),
+            "pitch_number": rng.integers(1, 12, rows),
+        }
+    ).convert_dtypes()
+
+
+def apply_pitch_id(df: pd.DataFrame) -> pd.Series:
+    """Previous row-wise implementation"""
+    return df.apply(
+        lambda x: _UNIQUE_IDENTIFIER_DELIMITER.join(
+            [str(x.get(col)) for col in _UNIQUE_IDENTIFIER_COLS]
+        ),
+        axis=1,
+    )
+
+
+def timed(func, df: pd.DataFrame) -> tuple:
+    start = time.perf_counter()
+    result = func(df)
+    return result, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    df = synthetic_df(_ROWS)
+
+    before, before_secs = timed(apply_pitch_id, df.head(_APPLY_ROWS))
+    after, after_secs = timed(build_pitch_id, df)
+    _, key_secs = timed(build_pitch_key, df)
+
+    assert before.equals(after.head(_APPLY_ROWS).astype(before.dtype))
+
+    print(f"apply (before):      {_APPLY_ROWS / before_secs:>14,.0f} rows/sec")
+    print(f"vectorized (after):  {_ROWS / after_secs:>14,.0f} rows/sec")
+    print(f"packed key (int64):  {_ROWS / key_secs:>14,.0f} rows/sec")
@@ -0,0 +1,72 @@
+# Benchmark umpire call misses (row-wise apply vs. vectorized)
+# Usage (from repo root): python -m benchmarks.umpire_calls [rows]
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+from mlb_videos.analysis.umpire_calls import (
+    _RETURN_COLS,
+    calculate_miss,
+    calculate_misses,
+)
+
+_ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 300_000
+_APPLY_ROWS = min(_ROWS, 50_000)
+
+
+def synthetic_df(rows: int) -> pd.DataFrame:
+    """Synthetic statcast-like frame of called pitches (nullable, as after convert_dtypes)
+
+    Coordinates are rounded to 2 decimals like statcast, so pitches on the zone
+    edges & rounding ties are covered, along with nulls, zeros & other descriptions
+    """
+    rng = np.random.default_rng(0)
+    sz_bot = rng.normal(1.6, 0.1, rows).round(2)
+    df = pd.DataFrame(
+        {
+            "description": rng.choice(
+                ["called_strike", "ball", "foul", "hit_into_play"],
+                rows,
+                p=[0.4, 0.5, 0.05, 0.05],
+            ),
+            "sz_bot": sz_bot,
+            "sz_top": (sz_bot + rng.normal(1.8, 0.1, rows)).round(2),
+            "plate_x": rng.normal(0, 0.9, rows).round(2),
+            "plate_z": rng.normal(2.5, 0.9, rows).round(2),
+            "stand": rng.choice(["R", "L"], rows),
+            "inning_topbot": rng.choice(["Top", "Bot"], rows),
+            "delta_home_win_exp": rng.normal(0, 0.02, rows).round(3),
+        }
+    )
+    for col in ["plate_x", "plate_z", "delta_home_win_exp"]:
+        df.loc[rng.random(rows) < 0.01, col] = np.nan
+        df.loc[rng.random(rows) < 0.005, col] = 0
+    return df.convert_dtypes()
+
+
+def apply_misses(df: pd.DataFrame) -> pd.DataFrame:
+    """Row-wise implementation (calculate_miss per row)"""
+    return df.apply(lambda x: calculate_miss(x), axis=1, result_type="expand").set_axis(
+        _RETURN_COLS, axis=1
+    )
+
+
+def timed(func, df: pd.DataFrame) -> tuple:
+    start = time.perf_counter()
+    result = func(df)
+    return result, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    df = synthetic_df(_ROWS)
+
+    before, before_secs = timed(apply_misses, df.head(_APPLY_ROWS))
+    after, after_secs = timed(calculate_misses, df)
+
+    pd.testing.assert_frame_equal(
+        before, after.head(_APPLY_ROWS), check_dtype=False, check_exact=True
+    )
+
+    print(f"apply (before):      {_APPLY_ROWS / before_secs:>14,.0f} rows/sec")
+    print(f"vectorized (after):  {_ROWS / after_secs:>14,.0f} rows/sec")
@@ -5,5 +5,6 @@ from .client import MLBVideoClient
 from .compilation import Compilation
 from .filmroom import FilmRoom
 from .statcast import Statcast
+from .async_statcast import AsyncStatcast
 from .statsapi import Game, Player
 from .youtube import YouTube
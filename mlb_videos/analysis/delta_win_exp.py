@@ -1,8 +1,10 @@
 import os
+import numpy as np
 import pandas as pd
 from typing import Tuple
 
 _DESCRIPTIONS = ["called_strike", "ball"]
+_USED_COLS = ["delta_home_win_exp", "inning_topbot"]
 _RETURN_COLS = ["batter_delta_win_exp", "pitcher_delta_win_exp"]
 
 
@@ -30,19 +32,53 @@ def calc_batter_pitcher_delta_win_exp(p: pd.Series) -> Tuple:
     )
 
 
-def get_pitcher_batter_delta_win_exp(df: pd.DataFrame) -> pd.DataFrame:
+def calc_batter_pitcher_delta_win_exps(df: pd.DataFrame) -> pd.DataFrame:
+    """Calc Batter Pitcher Delta Win Exps
+
+    Vectorized calc_batter_pitcher_delta_win_exp (all pitches at once)
+
+    Parameters
+    ----------
+        df : pd.DataFrame
+            statcast data (needs _USED_COLS)
+
+    Returns
+    -------
+        pd.DataFrame
+            _RETURN_COLS, same index as df
+    """
+    delta = pd.to_numeric(df["delta_home_win_exp"]).to_numpy(
+        dtype="float64", na_value=np.nan
+    )
+    home_batting = df["inning_topbot"].isin(["Bot"]).to_numpy(dtype=bool)
+    batter = np.where(home_batting, delta, -1 * delta)
+    return pd.DataFrame(dict(zip(_RETURN_COLS, [batter, -1 * batter])), index=df.index)
+
+
+def get_pitcher_batter_delta_win_exp(
+    df: pd.DataFrame, vectorized: bool = True
+) -> pd.DataFrame:
     """Get Pitcher/Batter Delta Win Exp
 
     Parameters
     ----------
         df : pd.DataFrame
             Statcast data to parse
+        vectorized (bool, optional): bool, default True
+            Use calc_batter_pitcher_delta_win_exps (whole columns) instead of the
+            row-wise calc_batter_pitcher_delta_win_exp (swifter apply)
 
     Returns
     -------
         pd.DataFrame
             Statcast data with batter/pitcher delta_win_exp added
     """
+    if vectorized:
+        df[_RETURN_COLS] = calc_batter_pitcher_delta_win_exps(df)
+        return df
+
+    import swifter
+
     df[_RETURN_COLS] = df.swifter.apply(
         lambda x: calc_batter_pitcher_delta_win_exp(x), axis=1, result_type="expand"
     )
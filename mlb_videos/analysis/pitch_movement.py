@@ -1,4 +1,5 @@
 import os
+import numpy as np
 import pandas as pd
 from typing import Tuple
 
@@ -34,7 +35,46 @@ def calc_pitch_movement(p: pd.Series) -> Tuple:
     )
 
 
-def get_pitch_movement(df: pd.DataFrame) -> pd.DataFrame:
+def calc_pitch_movements(df: pd.DataFrame) -> pd.DataFrame:
+    """Calc Pitch Movements
+
+    Vectorized calc_pitch_movement (all pitches at once),
+    pitches missing `pfx_x` or `pfx_z` get 0.00 for all four fields
+
+    Parameters
+    ----------
+        df : pd.DataFrame
+            statcast data (needs _USED_COLS)
+
+    Returns
+    -------
+        pd.DataFrame
+            _RETURN_COLS, same index as df
+    """
+    pfx_x, pfx_z = [
+        pd.to_numeric(df[col]).to_numpy(dtype="float64", na_value=np.nan)
+        for col in _USED_COLS
+    ]
+    valid = ~np.isnan(pfx_x) & ~np.isnan(pfx_z)
+    horizontal = np.where(valid, pfx_x * -12.00, 0.00)
+    vertical = np.where(valid, pfx_z * 12.00, 0.00)
+    return pd.DataFrame(
+        dict(
+            zip(
+                _RETURN_COLS,
+                [
+                    horizontal,
+                    vertical,
+                    horizontal + vertical,
+                    np.abs(horizontal) + np.abs(vertical),
+                ],
+            )
+        ),
+        index=df.index,
+    )
+
+
+def get_pitch_movement(df: pd.DataFrame, vectorized: bool = True) -> pd.DataFrame:
     """Get Pitch Movemement
 
     Adds four fields to dataframe
@@ -45,12 +85,21 @@ def get_pitch_movement(df: pd.DataFrame) -> pd.DataFrame:
     ----------
         df : pd.DataFrame
             Input statcast dataframe to transform
+        vectorized (bool, optional): bool, default True
+            Use calc_pitch_movements (whole columns) instead of the row-wise
+            calc_pitch_movement (swifter apply)
 
     Returns
     -------
         pd.DataFrame
             Transformed statcast dataframe
     """
+    if vectorized:
+        df[_RETURN_COLS] = calc_pitch_movements(df)
+        return df
+
+    import swifter
+
     df[_RETURN_COLS] = df.swifter.apply(
         lambda x: calc_pitch_movement(x)
         if not pd.isnull(x.pfx_x) and not pd.isnull(x.pfx_z)
@@ -0,0 +1,194 @@
+import pandas as pd
+import concurrent.futures
+
+from . import umpire_calls, delta_win_exp, pitch_movement
+
+import logging
+import logging.config
+
+logger = logging.getLogger(__name__)
+
+_PARALLEL_MIN_ROWS = 50_000
+_MAX_WORKERS = 4
+
+# Function: column-wise implementation, df[Inputs] -> pd.DataFrame of Outputs
+# Inputs: statcast (or upstream analysis) columns read
+# Outputs: columns added
+# Cost: relative cost per row, heavier analyses are started first
+_ANALYSIS_REGISTRY = {
+    "umpire_calls": {
+        "Function": umpire_calls.calculate_misses,
+        "Inputs": umpire_calls._USED_COLS,
+        "Outputs": umpire_calls._RETURN_COLS,
+        "Cost": 5,
+    },
+    "umpire_call_confidence": {
+        "Function": umpire_calls.calculate_call_confidence,
+        "Inputs": umpire_calls._CONFIDENCE_USED_COLS,
+        "Outputs": umpire_calls._CONFIDENCE_COLS,
+        "Cost": 2,
+    },
+    "pitcher_batter_delta_win_exp": {
+        "Function": delta_win_exp.calc_batter_pitcher_delta_win_exps,
+        "Inputs": delta_win_exp._USED_COLS,
+        "Outputs": delta_win_exp._RETURN_COLS,
+        "Cost": 1,
+    },
+    "pitch_movement": {
+        "Function": pitch_movement.calc_pitch_movements,
+        "Inputs": pitch_movement._USED_COLS,
+        "Outputs": pitch_movement._RETURN_COLS,
+        "Cost": 1,
+    },
+}
+
+
+def _analysis_cfg(name: str) -> dict:
+    """Registry entry for an analysis, raises if not registered"""
+    if name not in _ANALYSIS_REGISTRY:
+        raise Exception(
+            f"Unknown analysis: {name} (available: {', '.join(_ANALYSIS_REGISTRY)})"
+        )
+    return _ANALYSIS_REGISTRY.get(name)
+
+
+def analysis_inputs(names: list) -> list:
+    """Analysis Inputs
+
+    Columns read by the analyses, excluding those produced by another one of them
+
+    Parameters
+    ----------
+        names : list
+            analysis names (see _ANALYSIS_REGISTRY)
+
+    Returns
+    -------
+        list
+            column names
+    """
+    outputs = [col for name in names for col in _analysis_cfg(name).get("Outputs")]
+    return list(
+        dict.fromkeys(
+            col
+            for name in names
+            for col in _analysis_cfg(name).get("Inputs")
+            if col not in outputs
+        )
+    )
+
+
+def referenced_analysis(names: list, columns: list) -> list:
+    """Referenced Analysis
+
+    Analyses with at least one output in columns, or feeding one that has
+
+    Parameters
+    ----------
+        names : list
+            analysis names (see _ANALYSIS_REGISTRY)
+        columns : list
+            column names referenced downstream (queries, steps, etc.)
+
+    Returns
+    -------
+        list
+            analysis names, in the order passed
+    """
+    needed = set(columns)
+    keep = set()
+    for name in reversed(names):
+        cfg = _analysis_cfg(name)
+        if needed.intersection(cfg.get("Outputs")):
+            keep.add(name)
+            needed.update(cfg.get("Inputs"))
+    skipped = [name for name in names if name not in keep]
+    if skipped:
+        logging.info(f"Skipping unreferenced analysis: {', '.join(skipped)}")
+    return [name for name in names if name in keep]
+
+
+def _stages(names: list) -> list:
+    """Group analyses into stages -- each only reads outputs of earlier stages"""
+    stages, done, pending = [], set(), list(names)
+    while pending:
+        produced = {
+            col for name in pending for col in _analysis_cfg(name).get("Outputs")
+        }
+        stage = [
+            name
+            for name in pending
+            if not produced.intersection(_analysis_cfg(name).get("Inputs"))
+            - done
+            - set(_analysis_cfg(name).get("Outputs"))
+        ] or pending[:1]
+        stages.append(stage)
+        done.update(col for name in stage for col in _analysis_cfg(name).get("Outputs"))
+        pending = [name for name in pending if name not in stage]
+    return stages
+
+
+def run_analysis(
+    df: pd.DataFrame, names: list, max_workers: int = _MAX_WORKERS
+) -> pd.DataFrame:
+    """Run Analysis
+
+    Runs each analysis on its own block of input columns & adds the outputs to df
+    in one step (instead of each analysis transforming the full frame in turn).
+    Independent analyses run in parallel on large frames.
+
+    Parameters
+    ----------
+        df : pd.DataFrame
+            statcast data
+        names : list
+            analysis names (see _ANALYSIS_REGISTRY)
+        max_workers (int, optional): int, default _MAX_WORKERS
+            max threads, 1 to run serially
+
+    Returns
+    -------
+        pd.DataFrame
+            df w/ the outputs of each analysis added
+    """
+    names = list(dict.fromkeys(names))
+    results = {}
+    for stage in _stages(names):
+        stage = sorted(stage, key=lambda name: -_analysis_cfg(name).get("Cost"))
+        blocks = {}
+        for name in stage:
+            cfg = _analysis_cfg(name)
+            inputs = [
+                results.get(col) if col in results else df[col]
+                for col in cfg.get("Inputs")
+            ]
+            blocks[name] = pd.concat(inputs, axis=1)
+
+        if len(stage) > 1 and max_workers > 1 and len(df) >= _PARALLEL_MIN_ROWS:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(max_workers, len(stage))
+            ) as executor:
+                futures = {
+                    name: executor.submit(
+                        _analysis_cfg(name).get("Function"), blocks.get(name)
+                    )
+                    for name in stage
+                }
+                outputs = {name: future.result() for name, future in futures.items()}
+        else:
+            outputs = {
+                name: _analysis_cfg(name).get("Function")(blocks.get(name))
+                for name in stage
+            }
+        for name in stage:
+            results.update(outputs.get(name).items())
+            logging.info(f"Transformed DF: {name}")
+
+    added = [col for name in names for col in _analysis_cfg(name).get("Outputs")]
+    return pd.concat(
+        [
+            df.drop(columns=[c for c in added if c in df.columns]),
+            pd.DataFrame({col: results.get(col) for col in added}, index=df.index),
+        ],
+        axis=1,
+    )
@@ -1,8 +1,13 @@
 import os
-import swifter
+import numpy as np
 import pandas as pd
 from typing import Tuple
 
+try:
+    from scipy.special import ndtr
+except ImportError:
+    ndtr = None
+
 _AVG_ERROR = 0.25
 _SAMPLE = 10000
 _BALL_RADIUS = 0.12
@@ -20,7 +25,13 @@ _USED_COLS = [
     "plate_x",
     "plate_z",
     "stand",
+    "inning_topbot",
+    "delta_home_win_exp",
 ]
+_COORD_COLS = ["plate_x", "plate_z", "sz_bot", "sz_top"]
+_CONFIDENCE_USED_COLS = ["description"] + _COORD_COLS
+_CONFIDENCE_COLS = ["call_miss_probability", "call_miss_confident"]
+_MC_BATCH_DRAWS = 5_000_000
 _RETURN_COLS = [
     "horizontal_miss_type",
     "horizontal_miss",
@@ -79,7 +90,9 @@ def calc_adj_delta_win_exp(p: dict) -> float:
         float
             Delta Win Exp Change
     """
-    if p.get("description") == "ball":
+    if pd.isnull(p.get("delta_home_win_exp")):
+        return 0.00
+    elif p.get("description") == "ball":
         if p.get("inning_topbot") == "Bot" and p.get("delta_home_win_exp") > 0:
             return abs(p.get("delta_home_win_exp"))
         elif p.get("inning_topbot") == "Top" and p.get("delta_home_win_exp") < 0:
@@ -275,7 +288,101 @@ def calculate_miss(p: pd.Series) -> Tuple:
             return calc_ball_miss(d)
 
 
-def get_ump_calls(df: pd.DataFrame) -> pd.DataFrame:
+def _round(values: np.ndarray) -> np.ndarray:
+    """Round to 2 decimals, matching the builtin round
+
+    np.round scales by 100 first, which can flip values sitting on a tie
+    (i.e. 2.675) -- those few are rounded with the builtin instead
+    """
+    rounded = np.round(values, 2)
+    scaled = values * 100
+    ties = np.isfinite(values) & (np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6)
+    rounded[ties] = [round(float(v), 2) for v in values[ties]]
+    return rounded
+
+
+def _pick(conds: list, choices: list, default) -> np.ndarray:
+    """np.select that keeps None labels (object arrays)"""
+    return np.select(conds, choices, default=default).astype(object)
+
+
+def calculate_misses(df: pd.DataFrame) -> pd.DataFrame:
+    """Calculate Misses
+
+    Vectorized calculate_miss -- computes the miss fields for every pitch at once,
+    identical to applying calculate_miss row by row
+
+    Parameters
+    ----------
+        df : pd.DataFrame
+            statcast data (needs _USED_COLS)
+
+    Returns
+    -------
+        pd.DataFrame
+            _RETURN_COLS, same index as df
+    """
+    x, z, sz_bot, sz_top = [
+        pd.to_numeric(df[col]).to_numpy(dtype="float64", na_value=np.nan)
+        for col in _COORD_COLS
+    ]
+    delta = pd.to_numeric(df["delta_home_win_exp"]).to_numpy(
+        dtype="float64", na_value=np.nan
+    )
+    valid = np.ones(len(df), dtype=bool)
+    for vals in (x, z, sz_bot, sz_top):
+        valid &= ~np.isnan(vals) & (vals != 0)
+    strike = valid & df["description"].isin(["called_strike"]).to_numpy(dtype=bool)
+    ball = valid & df["description"].isin(["ball"]).to_numpy(dtype=bool)
+    righty = df["stand"].isin(["R"]).to_numpy(dtype=bool)
+    bot = df["inning_topbot"].isin(["Bot"]).to_numpy(dtype=bool)
+    top = df["inning_topbot"].isin(["Top"]).to_numpy(dtype=bool)
+    inside = np.where(righty, "inside", "outside")
+    outside = np.where(righty, "outside", "inside")
+    y1, y2 = sz_bot - _BALL_RADIUS, sz_top + _BALL_RADIUS
+
+    # Calls against the team in the field (strikes) / at bat (balls)
+    against = np.where(
+        strike,
+        (top & (delta > 0)) | (bot & (delta < 0)),
+        (bot & (delta > 0)) | (top & (delta < 0)),
+    )
+    adj_delta_win_exp = np.where(against, np.abs(delta), 0.00)
+
+    # Called strikes -- distance outside the zone
+    x_left, x_right = strike & (x < X1), strike & ~(x < X1) & (x > X2)
+    z_low, z_high = strike & (z < y1), strike & ~(z < y1) & (z > y2)
+    strike_h = _round(np.where(x_left, X1 - x, np.where(x_right, x - X2, 0.00)) * 12.00)
+    strike_v = _round(np.where(z_low, y1 - z, np.where(z_high, z - y2, 0.00)) * 12.00)
+    strike_h_type = _pick([x_left, x_right], [inside, outside], None)
+    strike_v_type = _pick([z_low, z_high], ["low", "high"], None)
+
+    # Called balls -- distance inside the zone (to the nearest edge)
+    in_zone = ball & (X1 < x) & (x < X2) & (y1 < z) & (z < y2)
+    mid = sz_bot + ((sz_top - sz_bot) / 2)
+    ball_h = np.where(in_zone, _round(np.where(x <= 0, x - X1, X2 - x) * 12.00), 0.00)
+    ball_v = np.where(in_zone, _round(np.where(z <= mid, z - y1, y2 - z) * 12.00), 0.00)
+    ball_h_type = _pick([in_zone & (x <= 0), in_zone], [inside, outside], None)
+    ball_v_type = _pick([in_zone & (z <= mid), in_zone], ["low", "high"], None)
+
+    h = np.where(strike, strike_h, ball_h)
+    v = np.where(strike, strike_v, ball_v)
+    h_type = np.where(strike, strike_h_type, ball_h_type)
+    v_type = np.where(strike, strike_v_type, ball_v_type)
+    total = np.where(
+        strike, _round(h + v), np.where(in_zone, _round(np.minimum(h, v)), 0.00)
+    )
+    total_type = _pick(
+        [(h > 0) & (v > 0), h > 0, v > 0], ["both", h_type, v_type], None
+    )
+    impact = np.where((strike & ((h > 0) | (v > 0))) | in_zone, adj_delta_win_exp, 0.00)
+    return pd.DataFrame(
+        dict(zip(_RETURN_COLS, [h_type, h, v_type, v, total_type, total, impact])),
+        index=df.index,
+    )
+
+
+def get_ump_calls(df: pd.DataFrame, vectorized: bool = True) -> pd.DataFrame:
     """Get Ump Calls
 
     Wrapper for all functions within umpire calls analysis
@@ -284,13 +391,170 @@ def get_ump_calls(df: pd.DataFrame) -> pd.DataFrame:
     ----------
         df : pd.DataFrame
             Dataframe to transform
+        vectorized (bool, optional): bool, default True
+            Use calculate_misses (whole columns) instead of the row-wise
+            calculate_miss (swifter apply)
 
     Returns
     -------
         pd.DataFrame
             Transformed dataframe
     """
+    if vectorized:
+        df[_RETURN_COLS] = calculate_misses(df)
+        return df
+
+    import swifter
+
     df[_RETURN_COLS] = df.swifter.apply(
         lambda x: calculate_miss(x), axis=1, result_type="expand"
     )
     return df
+
+
+def _norm_cdf(x: np.ndarray) -> np.ndarray:
+    """Standard normal CDF (scipy ndtr)
+
+    Falls back to an erf approximation (Abramowitz & Stegun 7.1.26, absolute
+    error < 1.5e-7) if scipy can't be imported
+    """
+    if ndtr is not None:
+        return ndtr(x)
+    z = np.abs(x) / np.sqrt(2)
+    t = 1.0 / (1.0 + 0.3275911 * z)
+    poly = t * (
+        0.254829592
+        + t * (-0.284496736 + t * (1.421413741 + t * (-1.453152027 + t * 1.061405429)))
+    )
+    erf = 1.0 - poly * np.exp(-z * z)
+    return 0.5 * (1.0 + np.sign(x) * erf)
+
+
+def zone_probability(
+    x: np.ndarray,
+    z: np.ndarray,
+    sz_bot: np.ndarray,
+    sz_top: np.ndarray,
+    monte_carlo: bool = False,
+    sample: int = _SAMPLE,
+    seed: int = None,
+) -> np.ndarray:
+    """Zone Probability
+
+    Probability each pitch truly passed through the zone (ball edge touching it),
+    given its tracked location -- the true location is taken as normally
+    distributed around plate_x / plate_z, with a std. dev. of _AVG_ERROR
+    (inches) on each axis
+
+    Parameters
+    ----------
+        x, z, sz_bot, sz_top : np.ndarray
+            plate_x, plate_z, sz_bot, sz_top (feet)
+        monte_carlo (bool, optional): bool, default False
+            Estimate by sampling instead of the closed-form normal CDF
+            Draws are batched across pitches (_MC_BATCH_DRAWS per batch)
+        sample (int, optional): int, default _SAMPLE
+            draws per pitch (monte_carlo)
+        seed (int, optional): int, default None
+            random seed (monte_carlo)
+
+    Returns
+    -------
+        np.ndarray
+            probability (0-1) per pitch
+    """
+    sigma = _AVG_ERROR / 12.00
+    y1, y2 = sz_bot - _BALL_RADIUS, sz_top + _BALL_RADIUS
+    if not monte_carlo:
+        p_x = _norm_cdf((X2 - x) / sigma) - _norm_cdf((X1 - x) / sigma)
+        p_z = _norm_cdf((y2 - z) / sigma) - _norm_cdf((y1 - z) / sigma)
+        return p_x * p_z
+
+    rng = np.random.default_rng(seed)
+    prob = np.empty(len(x))
+    batch = max(1, _MC_BATCH_DRAWS // sample)
+    for i in range(0, len(x), batch):
+        rows = slice(i, i + batch)
+        true_x = x[rows, None] + rng.normal(0, sigma, (len(x[rows]), sample))
+        true_z = z[rows, None] + rng.normal(0, sigma, (len(x[rows]), sample))
+        in_zone = (
+            (X1 < true_x)
+            & (true_x < X2)
+            & (y1[rows, None] < true_z)
+            & (true_z < y2[rows, None])
+        )
+        prob[rows] = in_zone.mean(axis=1)
+    return prob
+
+
+def calculate_call_confidence(
+    df: pd.DataFrame, monte_carlo: bool = False, seed: int = None
+) -> pd.DataFrame:
+    """Calculate Call Confidence
+
+    For each called pitch, the probability (%) that the call was wrong given
+    tracking error -- for a called strike, that the pitch was truly out of the
+    zone, for a ball, that it was truly in the zone. Calls above _PROB_REQ
+    are flagged. Other pitches (or missing coordinates) get 0.00 / False.
+
+    Parameters
+    ----------
+        df : pd.DataFrame
+            statcast data (needs _CONFIDENCE_USED_COLS)
+        monte_carlo (bool, optional): bool, default False
+            see zone_probability
+        seed (int, optional): int, default None
+            see zone_probability
+
+    Returns
+    -------
+        pd.DataFrame
+            _CONFIDENCE_COLS, same index as df
+    """
+    x, z, sz_bot, sz_top = [
+        pd.to_numeric(df[col]).to_numpy(dtype="float64", na_value=np.nan)
+        for col in _COORD_COLS
+    ]
+    valid = np.ones(len(df), dtype=bool)
+    for vals in (x, z, sz_bot, sz_top):
+        valid &= ~np.isnan(vals) & (vals != 0)
+    strike = valid & df["description"].isin(["called_strike"]).to_numpy(dtype=bool)
+    ball = valid & df["description"].isin(["ball"]).to_numpy(dtype=bool)
+
+    called = strike | ball
+    in_zone = np.zeros(len(df))
+    in_zone[called] = zone_probability(
+        x[called],
+        z[called],
+        sz_bot[called],
+        sz_top[called],
+        monte_carlo=monte_carlo,
+        seed=seed,
+    )
+    prob = np.round(
+        np.where(strike, 1.0 - in_zone, np.where(ball, in_zone, 0.00)) * 100.00, 2
+    )
+    return pd.DataFrame(
+        dict(zip(_CONFIDENCE_COLS, [prob, called & (prob > _PROB_REQ)])),
+        index=df.index,
+    )
+
+
+def get_call_confidence(df: pd.DataFrame) -> pd.DataFrame:
+    """Get Call Confidence
+
+    Adds `call_miss_probability` (%) & `call_miss_confident` (> _PROB_REQ)
+    for each called pitch, see calculate_call_confidence
+
+    Parameters
+    ----------
+        df : pd.DataFrame
+            Dataframe to transform
+
+    Returns
+    -------
+        pd.DataFrame
+            Transformed dataframe
+    """
+    df[_CONFIDENCE_COLS] = calculate_call_confidence(df)
+    return df
@@ -0,0 +1,258 @@
+import os
+import asyncio
+import pandas as pd
+from tqdm import tqdm
+import concurrent.futures
+
+from .statcast import (
+    Statcast,
+    parse_statcast_content,
+    _DEFAULT_SORT,
+    _REQUEST_RETRIES,
+    _REQUEST_TIMEOUT,
+)
+from .constants import _DT_FORMAT
+from .planner import _SAVANT_ROW_CAP, plan_chunks
+from .session import get_with_retry_async, aiohttp
+
+import logging
+import logging.config
+
+logger = logging.getLogger(__name__)
+
+_MAX_IN_FLIGHT = 100
+_PARSE_WORKERS = os.cpu_count()
+
+
+class AsyncStatcast(Statcast):
+    """Statcast API Client (asyncio)
+
+    Same interface & results as Statcast, but requests are performed on an event loop
+    (aiohttp), with up to max_in_flight requests at once on a single thread.
+    CSV parsing & local store/cache I/O run in a worker pool, off the event loop.
+    Suited to long (multi-season) date ranges.
+
+    Requires aiohttp (see requirements.txt) -- raises ImportError on init without it.
+    """
+
+    def __init__(
+        self,
+        *args,
+        max_in_flight: int = _MAX_IN_FLIGHT,
+        parse_workers: int = _PARSE_WORKERS,
+        **kwargs,
+    ):
+        """Initialize Async Statcast API Client
+
+        Parameters
+        ----------
+            *args, **kwargs
+                see Statcast (max_workers is not used, rate_limit still applies)
+            max_in_flight (int, optional): int, default _MAX_IN_FLIGHT
+                Max concurrent requests
+            parse_workers (int, optional): int, default _PARSE_WORKERS
+                Threads used to parse responses & read/write the local store/cache
+
+        Raises
+        ------
+            ImportError
+                If aiohttp is not installed
+        """
+        if aiohttp is None:
+            raise ImportError(f"AsyncStatcast requires aiohttp: pip install aiohttp")
+        self.max_in_flight = max_in_flight
+        self.parse_workers = parse_workers
+        super().__init__(*args, **kwargs)
+
+    def concurrent_requests(self) -> None:
+        """Concurrent Requests -> Statcast API (asyncio)
+
+        Runs the event loop until all chunks complete --
+        from within a running loop (i.e. notebooks), init w/ lazy=True & await run_async()
+        """
+        asyncio.run(self.run_async())
+
+    async def run_async(self) -> None:
+        """Request all chunks on the current event loop, collect the results
+
+        Results are kept in iteration order (see Statcast._collect)
+        A chunk that fails is recorded in self.errors instead of stopping the run
+        """
+        self._load_synced()
+        chunks = self._plan_chunks()
+        logging.info(f"Starting async statcast iterations..")
+        semaphore = asyncio.Semaphore(self.max_in_flight)
+        connector = aiohttp.TCPConnector(limit=self.max_in_flight)
+        timeout = aiohttp.ClientTimeout(
+            sock_connect=_REQUEST_TIMEOUT[0], sock_read=_REQUEST_TIMEOUT[1]
+        )
+        with concurrent.futures.ThreadPoolExecutor(self.parse_workers) as pool:
+            async with aiohttp.ClientSession(
+                connector=connector, timeout=timeout
+            ) as http:
+                tasks = [
+                    self._indexed(
+                        i, self._make_request_async(http, semaphore, pool, chunk)
+                    )
+                    for i, chunk in enumerate(chunks)
+                ]
+                with tqdm(total=len(chunks)) as progress:
+                    for task in asyncio.as_completed(tasks):
+                        i, df, error = await task
+                        try:
+                            if error is not None:
+                                raise error
+                            self._collect(i, df)
+                        except Exception as e:
+                            self._record_error(chunks[i], e)
+                        progress.update(1)
+        self._flush_results()
+        logging.info(f"Completed async statcast iterations..")
+
+    @staticmethod
+    async def _indexed(i: int, coro) -> tuple:
+        """Await coro, returning (i, result, exception raised or None)"""
+        try:
+            return i, await coro, None
+        except Exception as e:
+            return i, None, e
+
+    async def _make_request_async(
+        self,
+        http: "aiohttp.ClientSession",
+        semaphore: asyncio.Semaphore,
+        pool: concurrent.futures.Executor,
+        chunk: list,
+    ) -> pd.DataFrame:
+        """Make Request to Statcast API (asyncio)
+
+        See Statcast._make_request -- local store/cache first, then the missing ranges
+
+        Parameters
+        ----------
+            http : aiohttp.ClientSession
+                HTTP session
+            semaphore : asyncio.Semaphore
+                limits requests in flight
+            pool : concurrent.futures.Executor
+                worker pool for parsing & disk I/O
+            chunk : list
+                Values being iterated over for the current iteration
+
+        Returns
+        -------
+            pd.DataFrame
+                Dataframe for the iteration (without any failed values)
+        """
+        loop = asyncio.get_running_loop()
+        results = {}
+        pending = []
+        for iter_val in chunk:
+            df = await loop.run_in_executor(pool, self._load_local, iter_val)
+            if df is not None:
+                results[iter_val] = df
+            else:
+                pending.append(iter_val)
+
+        if self.iteration_type == "dates":
+            ranges = plan_chunks(pending, len(pending)) if pending else []
+        else:
+            ranges = [[iter_val] for iter_val in pending]
+        for rng in ranges:
+            try:
+                fetched = await self._fetch_range_async(http, semaphore, pool, rng)
+            except Exception as e:
+                self._record_error(rng, e)
+                continue
+            for iter_val, df in fetched.items():
+                await loop.run_in_executor(pool, self._save_local, iter_val, df)
+                results[iter_val] = self._project(df)
+
+        dfs = [results.get(iter_val) for iter_val in chunk if iter_val in results]
+        if not dfs:
+            return pd.DataFrame()
+        return pd.concat(dfs, axis=0, ignore_index=True)
+
+    async def _fetch_range_async(
+        self,
+        http: "aiohttp.ClientSession",
+        semaphore: asyncio.Semaphore,
+        pool: concurrent.futures.Executor,
+        rng: list,
+    ) -> dict:
+        """Fetch a range of iteration values (asyncio)
+
+        See Statcast._fetch_range -- a truncated range is split in half & retried,
+        both halves concurrently
+
+        Returns
+        -------
+            dict
+                iteration value -> Dataframe
+        """
+        df = await self._fetch_async(http, semaphore, pool, rng[0], rng[-1])
+        if len(df) >= _SAVANT_ROW_CAP:
+            if len(rng) > 1:
+                logging.warning(
+                    f"Response truncated at {len(df)} rows for {rng[0]} - {rng[-1]}, "
+                    f"splitting range & retrying.."
+                )
+                mid = len(rng) // 2
+                left, right = await asyncio.gather(
+                    self._fetch_range_async(http, semaphore, pool, rng[:mid]),
+                    self._fetch_range_async(http, semaphore, pool, rng[mid:]),
+                )
+                return {**left, **right}
+            logging.warning(f"Response truncated at {len(df)} rows for {rng[0]}.")
+
+        if len(rng) == 1:
+            return {rng[0]: df}
+        if df.empty:
+            return {iter_val: df for iter_val in rng}
+        dates = pd.to_datetime(df["game_date"]).dt.strftime(_DT_FORMAT)
+        return {iter_val: df[dates == iter_val] for iter_val in rng}
+
+    async def _fetch_async(
+        self,
+        http: "aiohttp.ClientSession",
+        semaphore: asyncio.Semaphore,
+        pool: concurrent.futures.Executor,
+        iter_val: str,
+        end_val: str = None,
+    ) -> pd.DataFrame:
+        """Fetch iteration from Statcast API (asyncio), parsed in the worker pool
+
+        Returns
+        -------
+            pd.DataFrame
+                Dataframe for the iteration
+        """
+        content = await self._get_async(
+            http, semaphore, self._build_url(iter_val, end_val)
+        )
+        df = await asyncio.get_running_loop().run_in_executor(
+            pool, parse_statcast_content, content
+        )
+        if not df.empty:
+            df = df.sort_values(_DEFAULT_SORT, ascending=True)
+        return df
+
+    async def _get_async(
+        self, http: "aiohttp.ClientSession", semaphore: asyncio.Semaphore, url: str
+    ) -> bytes:
+        """GET w/ rate limiting & jittered exponential backoff (asyncio)
+
+        See session.get_with_retry_async
+
+        Returns
+        -------
+            bytes
+                response body
+        """
+        return await get_with_retry_async(
+            http,
+            url,
+            limiter=self.limiter,
+            retries=_REQUEST_RETRIES,
+            semaphore=semaphore,
+        )
@@ -0,0 +1,160 @@
+import os
+import json
+import time
+import sqlite3
+import contextlib
+import pathlib
+from typing import Iterator
+
+import logging
+import logging.config
+
+logger = logging.getLogger(__name__)
+
+_METADATA_CACHE_PATH = (
+    f"{os.path.dirname(os.path.abspath(__file__))}/metadata/metadata.sqlite"
+)
+_FINAL_GAME_TTL = 365 * 24 * 60 * 60
+_LIVE_GAME_TTL = 5 * 60
+_PLAYER_TTL = 30 * 24 * 60 * 60
+_SQLITE_MAX_PARAMS = 900
+
+
+class MetadataCache:
+    """SQLite key-value cache of StatsAPI metadata (games, players), w/ per-entry TTL"""
+
+    def __init__(self, path: str = _METADATA_CACHE_PATH):
+        """Initialize Metadata Cache
+
+        Entries are JSON values keyed by (kind, key), i.e. ("game", "717465"),
+        each with its own expiry
+
+        Parameters
+        ----------
+            path (str, optional): str, default _METADATA_CACHE_PATH
+                sqlite database file
+        """
+        self.path = pathlib.Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS metadata (
+                    kind TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    expires REAL NOT NULL,
+                    PRIMARY KEY (kind, key)
+                ) WITHOUT ROWID
+                """)
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """New connection (one per call, so the cache can be shared across threads)
+
+        Commits (or rolls back on error) & closes the connection on exit
+        """
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get_many(self, kind: str, keys: list) -> dict:
+        """Get unexpired entries
+
+        Parameters
+        ----------
+            kind : str
+                entity kind (i.e. game, player)
+            keys : list
+                keys to look up
+
+        Returns
+        -------
+            dict
+                key (str) -> value, for the keys found
+        """
+        keys = [str(k) for k in dict.fromkeys(keys)]
+        found = {}
+        now = time.time()
+        with self._connect() as conn:
+            for i in range(0, len(keys), _SQLITE_MAX_PARAMS):
+                batch = keys[i : i + _SQLITE_MAX_PARAMS]
+                rows = conn.execute(
+                    f"SELECT key, value FROM metadata WHERE kind = ? AND expires > ? "
+                    f"AND key IN ({','.join('?' * len(batch))})",
+                    [kind, now] + batch,
+                )
+                found.update({k: json.loads(v) for k, v in rows})
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        logging.info(f"Metadata cache ({kind}): {len(found)}/{len(keys)} hit(s)")
+        return found
+
+    def put_many(self, kind: str, items: dict, ttl: float) -> None:
+        """Put entries (replacing existing ones)
+
+        Parameters
+        ----------
+            kind : str
+                entity kind (i.e. game, player)
+            items : dict
+                key -> value (JSON serializable)
+            ttl : float
+                seconds until the entries expire
+        """
+        if not items:
+            return
+        expires = time.time() + ttl
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO metadata (kind, key, value, expires) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    (kind, str(k), json.dumps(v, default=str), expires)
+                    for k, v in items.items()
+                ],
+            )
+
+    def purge_expired(self) -> int:
+        """Delete expired entries
+
+        Returns
+        -------
+            int
+                entries deleted
+        """
+        with self._connect() as conn:
+            deleted = conn.execute(
+                "DELETE FROM metadata WHERE expires <= ?", [time.time()]
+            ).rowcount
+        logging.info(f"Purged {deleted} expired metadata cache entries.")
+        return deleted
+
+    def clear(self, kind: str = None) -> None:
+        """Delete all entries (of a kind, if passed)
+
+        Parameters
+        ----------
+            kind (str, optional): str, default None
+                entity kind (i.e. game, player)
+        """
+        with self._connect() as conn:
+            if kind:
+                conn.execute("DELETE FROM metadata WHERE kind = ?", [kind])
+            else:
+                conn.execute("DELETE FROM metadata")
+
+    def stats(self) -> dict:
+        """Cache Stats
+
+        Returns
+        -------
+            dict
+                hits, misses
+        """
+        return {"hits": self.hits, "misses": self.misses}
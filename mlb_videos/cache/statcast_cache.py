@@ -0,0 +1,270 @@
+import os
+import json
+import hashlib
+import pathlib
+import threading
+import pandas as pd
+from datetime import datetime, timedelta
+from typing import Union
+
+from ..constants import _DT_FORMAT
+
+import logging
+import logging.config
+
+logger = logging.getLogger(__name__)
+
+_CACHE_MAX_BYTES = 2 * 1024**3
+_CACHE_EVICT_TARGET = 0.9
+_CACHE_REFRESH_DAYS = 1
+_CACHE_FILE_SUFFIX = ".pkl"
+_CACHE_META_FILE = "filters.json"
+
+
+def filter_key(filters: dict) -> str:
+    """Filter Key
+
+    Builds a stable hash for a set of statcast filters,
+    so results are only reused for the exact same request params
+
+    Parameters
+    ----------
+        filters : dict
+            statcast filter params (pitch_types, events, etc.)
+
+    Returns
+    -------
+        str
+            sha1 hex digest of the filters
+    """
+    return hashlib.sha1(
+        json.dumps(filters, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def is_final_date(
+    game_date: Union[str, datetime], refresh_days: int = _CACHE_REFRESH_DAYS
+) -> bool:
+    """Is Final Date
+
+    Whether a date's data is finalized -- Savant still updates dates on/after
+    today - refresh_days
+
+    Parameters
+    ----------
+        game_date : Union[str, datetime]
+            date (i.e. "2023-09-01")
+        refresh_days (int, optional): int, default _CACHE_REFRESH_DAYS
+            days Savant may still update a date for
+
+    Returns
+    -------
+        bool
+    """
+    if isinstance(game_date, str):
+        game_date = datetime.strptime(game_date, _DT_FORMAT)
+    cutoff = (datetime.now() - timedelta(days=refresh_days)).date()
+    return pd.Timestamp(game_date).date() < cutoff
+
+
+class StatcastCache:
+    """On-disk cache of parsed Statcast iteration results"""
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = _CACHE_MAX_BYTES,
+        refresh_days: int = _CACHE_REFRESH_DAYS,
+    ):
+        """Initialize Statcast Cache
+
+        Each iteration result (one date or one game) is stored as a pickled
+        dataframe under a folder per filter set. Dates within `refresh_days`
+        of today are never written to the cache, as Savant is still updating them.
+
+        Parameters
+        ----------
+            path : str
+                root folder of the cache (i.e. statcast._CACHE_PATH)
+            max_bytes (int, optional): int, default _CACHE_MAX_BYTES
+                size cap of the cache, least recently used files are evicted past this
+                (down to _CACHE_EVICT_TARGET of the cap)
+            refresh_days (int, optional): int, default _CACHE_REFRESH_DAYS
+                dates on/after today - refresh_days are always refetched
+        """
+        self.path = pathlib.Path(path)
+        self.max_bytes = max_bytes
+        self.refresh_days = refresh_days
+        self.hits = 0
+        self.misses = 0
+        self._size = None
+        self._lock = threading.Lock()
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def _file_path(self, filters: dict, iter_val: Union[str, int]) -> pathlib.Path:
+        """Path to cache file for a filter set + iteration value"""
+        return self.path / filter_key(filters) / f"{iter_val}{_CACHE_FILE_SUFFIX}"
+
+    @staticmethod
+    def _is_date(iter_val: Union[str, int]) -> bool:
+        """Whether the iteration value is a date (vs. a game_pk)"""
+        try:
+            datetime.strptime(str(iter_val), _DT_FORMAT)
+            return True
+        except ValueError:
+            return False
+
+    def is_final(self, df: pd.DataFrame = None, iter_val: str = None) -> bool:
+        """Is Final
+
+        Determines whether an iteration's data is finalized (safe to cache)
+        Uses the iteration date if iterating by dates, otherwise the max game_date
+
+        Parameters
+        ----------
+            df (pd.DataFrame, optional): pd.DataFrame, default None
+                iteration result
+            iter_val (str, optional): str, default None
+                date being iterated over
+
+        Returns
+        -------
+            bool
+                True if all data is older than the refresh window
+        """
+        if iter_val is not None:
+            return is_final_date(str(iter_val), self.refresh_days)
+        if df is None or df.empty or "game_date" not in df.columns:
+            return False
+        return is_final_date(pd.to_datetime(df["game_date"]).max(), self.refresh_days)
+
+    def get(
+        self, filters: dict, iter_val: Union[str, int]
+    ) -> Union[pd.DataFrame, None]:
+        """Get cached iteration result
+
+        Parameters
+        ----------
+            filters : dict
+                statcast filter params
+            iter_val : Union[str, int]
+                date or game_pk
+
+        Returns
+        -------
+            Union[pd.DataFrame, None]
+                cached dataframe, None if not cached
+        """
+        fp = self._file_path(filters, iter_val)
+        df = None
+        if fp.exists():
+            try:
+                df = pd.read_pickle(fp)
+                os.utime(fp)
+            except Exception as e:
+                logging.warning(f"Failed to read cache file {fp}: {e}")
+                df = None
+
+        with self._lock:
+            if df is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return df
+
+    def put(self, filters: dict, iter_val: Union[str, int], df: pd.DataFrame) -> None:
+        """Store iteration result
+
+        Results that are not final yet (today/yesterday) are skipped,
+        so they are always refetched on the next run
+
+        Parameters
+        ----------
+            filters : dict
+                statcast filter params
+            iter_val : Union[str, int]
+                date or game_pk
+            df : pd.DataFrame
+                parsed iteration result
+        """
+        if not self.is_final(df, iter_val if self._is_date(iter_val) else None):
+            return
+
+        fp = self._file_path(filters, iter_val)
+        fp.parent.mkdir(parents=True, exist_ok=True)
+        meta_fp = fp.parent / _CACHE_META_FILE
+        if not meta_fp.exists():
+            with open(meta_fp, "w") as f:
+                json.dump(filters, f, sort_keys=True, default=str)
+
+        old_size = fp.stat().st_size if fp.exists() else 0
+        tmp_fp = fp.with_suffix(f".{threading.get_ident()}.tmp")
+        df.to_pickle(tmp_fp)
+        size = tmp_fp.stat().st_size
+        os.replace(tmp_fp, fp)
+
+        with self._lock:
+            if self._size is None:
+                self._size = sum(f[1] for f in self._files())
+            else:
+                self._size += size - old_size
+            over = self._size > self.max_bytes
+        if over:
+            self.evict()
+
+    def _files(self) -> list:
+        """(mtime, size, path) of each cached file"""
+        files = []
+        for fp in self.path.glob(f"*/*{_CACHE_FILE_SUFFIX}"):
+            try:
+                st = fp.stat()
+            except FileNotFoundError:
+                continue
+            files.append((st.st_mtime, st.st_size, fp))
+        return files
+
+    def evict(self) -> None:
+        """Evict least recently used files
+
+        Only scans the cache once the tracked size passes max_bytes (see put),
+        then evicts down to _CACHE_EVICT_TARGET of it, so scans stay infrequent
+        """
+        with self._lock:
+            files = self._files()
+            total = sum(f[1] for f in files)
+            self._size = total
+            if total <= self.max_bytes:
+                return
+            target = self.max_bytes * _CACHE_EVICT_TARGET
+            for _, size, fp in sorted(files, key=lambda x: x[0]):
+                if total <= target:
+                    break
+                try:
+                    fp.unlink()
+                    total -= size
+                except FileNotFoundError:
+                    continue
+            self._size = total
+            logging.info(f"Evicted statcast cache files, size now {total} bytes.")
+
+    def clear(self) -> None:
+        """Remove all cached files"""
+        with self._lock:
+            for fp in self.path.glob(f"*/*"):
+                fp.unlink()
+            self._size = 0
+
+    def stats(self) -> dict:
+        """Cache hit/miss counters
+
+        Returns
+        -------
+            dict
+                hits, misses, hit_rate
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
@@ -0,0 +1,346 @@
+import os
+import json
+import pathlib
+import threading
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from typing import Union
+
+from .statcast_cache import filter_key
+from ..query import parse_predicates, query_columns, match_partition
+
+import logging
+import logging.config
+
+logger = logging.getLogger(__name__)
+
+_STORE_PARTITION = "game_date"
+_STORE_FILE_NAME = "part-0.parquet"
+_STORE_META_FILE = "filters.json"
+_STORE_WATERMARK_FILE = "watermark.json"
+_STORE_COMPRESSION = "zstd"
+_STORE_ROW_GROUP_ROWS = 1024
+_STORE_PUSHDOWN_COLS = [
+    "game_pk",
+    "pitcher",
+    "batter",
+    "events",
+    "pitch_type",
+    "description",
+]
+_STORE_PUSHDOWN_OPS = ["==", "<", "<=", ">", ">=", "in"]
+
+
+class StatcastStore:
+    """Columnar (Parquet) store of Statcast pitches, partitioned by game date"""
+
+    def __init__(self, path: str, compression: str = _STORE_COMPRESSION):
+        """Initialize Statcast Store
+
+        Layout is one folder per filter set, with a hive-style partition per date:
+            {path}/{filter_key}/game_date=2023-09-01/part-0.parquet
+
+        Parameters
+        ----------
+            path : str
+                root folder of the store
+            compression (str, optional): str, default _STORE_COMPRESSION
+                parquet compression codec
+        """
+        self.path = pathlib.Path(path)
+        self.compression = compression
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def _root(self, filters: dict) -> pathlib.Path:
+        """Folder for a filter set"""
+        return self.path / filter_key(filters)
+
+    def _partition_path(self, filters: dict, game_date: str) -> pathlib.Path:
+        """Parquet file path for a filter set + date"""
+        return (
+            self._root(filters) / f"{_STORE_PARTITION}={game_date}" / _STORE_FILE_NAME
+        )
+
+    @staticmethod
+    def _to_table(df: pd.DataFrame) -> pa.Table:
+        """Convert dataframe to arrow table
+
+        Object columns with mixed python types are cast to str, as arrow requires
+        a single type per column
+
+        Parameters
+        ----------
+            df : pd.DataFrame
+
+        Returns
+        -------
+            pa.Table
+        """
+        try:
+            return pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowTypeError, pa.ArrowInvalid):
+            df = df.copy()
+            for col in df.select_dtypes(include="object").columns:
+                df[col] = df[col].where(df[col].isnull(), df[col].astype(str))
+            return pa.Table.from_pandas(df, preserve_index=False)
+
+    def write(self, filters: dict, df: pd.DataFrame) -> list:
+        """Write dataframe to store, one partition per game date
+
+        Existing partitions for the same dates are replaced
+
+        Parameters
+        ----------
+            filters : dict
+                statcast filter params
+            df : pd.DataFrame
+                parsed statcast data
+
+        Returns
+        -------
+            list
+                dates written
+        """
+        if df is None or df.empty:
+            return []
+
+        root = self._root(filters)
+        root.mkdir(parents=True, exist_ok=True)
+        meta_fp = root / _STORE_META_FILE
+        if not meta_fp.exists():
+            with open(meta_fp, "w") as f:
+                json.dump(filters, f, sort_keys=True, default=str)
+
+        dates = pd.to_datetime(df[_STORE_PARTITION]).dt.strftime("%Y-%m-%d")
+        written = []
+        for game_date, part_df in df.groupby(dates.values, sort=True):
+            fp = self._partition_path(filters, game_date)
+            fp.parent.mkdir(parents=True, exist_ok=True)
+            tmp_fp = fp.with_suffix(f".{threading.get_ident()}.tmp")
+            pq.write_table(
+                self._to_table(part_df),
+                tmp_fp,
+                compression=self.compression,
+                row_group_size=_STORE_ROW_GROUP_ROWS,
+            )
+            os.replace(tmp_fp, fp)
+            written.append(game_date)
+        logging.info(f"Wrote {len(written)} partition(s) to statcast store.")
+        return written
+
+    def has(self, filters: dict, game_date: str) -> bool:
+        """Whether a date is in the store for the filter set
+
+        Parameters
+        ----------
+            filters : dict
+                statcast filter params
+            game_date : str
+                date (i.e. "2023-09-01")
+
+        Returns
+        -------
+            bool
+        """
+        return self._partition_path(filters, game_date).exists()
+
+    def dates(self, filters: dict) -> list:
+        """List stored dates for a filter set
+
+        Parameters
+        ----------
+            filters : dict
+                statcast filter params
+
+        Returns
+        -------
+            list
+                sorted list of dates (str)
+        """
+        return sorted(
+            p.parent.name.split("=", 1)[1]
+            for p in self._root(filters).glob(
+                f"{_STORE_PARTITION}=*/{_STORE_FILE_NAME}"
+            )
+        )
+
+    def get_watermark(self, filters: dict) -> Union[dict, None]:
+        """Get watermark for a filter set
+
+        The watermark is the synced date range: from `start` through `watermark`
+        (the last fully-ingested date), every date is in the store
+
+        Parameters
+        ----------
+            filters : dict
+                statcast filter params
+
+        Returns
+        -------
+            Union[dict, None]
+                {"start": "2023-03-30", "watermark": "2023-09-01"}, None if never synced
+        """
+        fp = self._root(filters) / _STORE_WATERMARK_FILE
+        if not fp.exists():
+            return None
+        with open(fp, "r") as f:
+            data = json.load(f)
+        return {"start": data.get("start"), "watermark": data.get("watermark")}
+
+    def set_watermark(self, filters: dict, start: str, watermark: str) -> None:
+        """Set watermark for a filter set
+
+        Parameters
+        ----------
+            filters : dict
+                statcast filter params
+            start : str
+                first synced date (i.e. "2023-03-30")
+            watermark : str
+                last fully-ingested date (i.e. "2023-09-01")
+        """
+        root = self._root(filters)
+        root.mkdir(parents=True, exist_ok=True)
+        tmp_fp = root / f"{_STORE_WATERMARK_FILE}.{threading.get_ident()}.tmp"
+        with open(tmp_fp, "w") as f:
+            json.dump(
+                {"start": start, "watermark": watermark, "filters": filters},
+                f,
+                default=str,
+            )
+        os.replace(tmp_fp, root / _STORE_WATERMARK_FILE)
+        logging.info(f"Set statcast store watermark: {start} - {watermark}")
+
+    def query(
+        self, filters: dict, queries: Union[list, str], columns: list = None
+    ) -> pd.DataFrame:
+        """Query store
+
+        Applies df.query strings to the stored data for a filter set, without loading
+        all of it -- simple predicates in the queries (see parse_predicates) are pushed
+        down to skip date partitions (game_date, game_year) and to filter rows/row groups
+        as they are read (_STORE_PUSHDOWN_COLS). The full queries are applied after.
+
+        Parameters
+        ----------
+            filters : dict
+                statcast filter params
+            queries : Union[list, str]
+                query string(s), as passed to df.query
+                i.e. "events == 'home_run' and game_year == 2023"
+            columns (list, optional): list, default None
+                columns to return (plus those referenced by the queries), all if None
+
+        Returns
+        -------
+            pd.DataFrame
+                statcast data matching all queries
+        """
+        queries = [queries] if isinstance(queries, str) else list(queries or [])
+        predicates = [p for query in queries for p in parse_predicates(query)]
+        dates = [d for d in self.dates(filters) if match_partition(d, predicates)]
+        row_filters = [
+            p
+            for p in predicates
+            if p[0] in _STORE_PUSHDOWN_COLS and p[1] in _STORE_PUSHDOWN_OPS
+        ]
+        if columns is not None:
+            columns = list(
+                dict.fromkeys(
+                    list(columns)
+                    + [c for query in queries for c in query_columns(query)]
+                )
+            )
+        logging.info(
+            f"Querying statcast store: {len(dates)} partition(s), "
+            f"row filters: {row_filters}"
+        )
+
+        df = self.read(filters, dates, columns, row_filters)
+        # Nothing left to query (no partitions may have been read -- no columns)
+        if df.empty:
+            return df.reset_index(drop=True)
+        for query in queries:
+            df = df.query(query)
+        return df.reset_index(drop=True)
+
+    def read(
+        self,
+        filters: dict,
+        dates: list = None,
+        columns: list = None,
+        row_filters: list = None,
+    ) -> pd.DataFrame:
+        """Read from store
+
+        Only the requested dates (partitions) and columns are read from disk
+
+        Parameters
+        ----------
+            filters : dict
+                statcast filter params
+            dates (list, optional): list, default None
+                dates to read, all stored dates if None
+            columns (list, optional): list, default None
+                columns to read, all columns if None
+            row_filters (list, optional): list, default None
+                (column, op, value) filters applied while reading, skipping
+                row groups whose statistics can't match
+
+        Returns
+        -------
+            pd.DataFrame
+                statcast data
+        """
+        dates = self.dates(filters) if dates is None else dates
+        df_list = [
+            self._read_partition(filters, game_date, columns, row_filters)
+            for game_date in dates
+            if self.has(filters, game_date)
+        ]
+        if not df_list:
+            return pd.DataFrame(columns=columns)
+        return pd.concat(df_list, axis=0, ignore_index=True)
+
+    def _read_partition(
+        self,
+        filters: dict,
+        game_date: str,
+        columns: list = None,
+        row_filters: list = None,
+    ) -> pd.DataFrame:
+        """Read a single partition, projecting to columns that exist in the file
+
+        Row filters on columns missing from the file are dropped, if the filters
+        don't match the column types the partition is read unfiltered
+
+        Parameters
+        ----------
+            filters : dict
+                statcast filter params
+            game_date : str
+                date (i.e. "2023-09-01")
+            columns (list, optional): list, default None
+                columns to read
+            row_filters (list, optional): list, default None
+                (column, op, value) filters
+
+        Returns
+        -------
+            pd.DataFrame
+        """
+        fp = self._partition_path(filters, game_date)
+        if columns is not None or row_filters:
+            file_columns = pq.read_schema(fp).names
+            if columns is not None:
+                columns = [c for c in columns if c in file_columns]
+            row_filters = [f for f in row_filters or [] if f[0] in file_columns]
+        if row_filters:
+            try:
+                return pq.read_table(
+                    fp, columns=columns, filters=row_filters
+                ).to_pandas()
+            except (pa.ArrowException, TypeError) as e:
+                logging.info(f"Could not push filters down for {game_date}: {e}")
+        return pq.read_table(fp, columns=columns).to_pandas()
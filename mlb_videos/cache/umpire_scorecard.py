@@ -0,0 +1,328 @@
+import os
+import sqlite3
+import contextlib
+import pathlib
+import pandas as pd
+from typing import Iterator
+
+from ..analysis.umpire_calls import calculate_misses, _RETURN_COLS
+
+import logging
+import logging.config
+
+logger = logging.getLogger(__name__)
+
+_SCORECARD_PATH = (
+    f"{os.path.dirname(os.path.abspath(__file__))}/scorecards/umpires.sqlite"
+)
+_UMPIRE_COL = "umpires_home_plate"
+_CALLED_DESCRIPTIONS = ["called_strike", "ball"]
+_MISSED_CALL_COLS = [
+    "pitch_id",
+    "umpire",
+    "game_date",
+    "game_pk",
+    "batter",
+    "pitcher",
+    "description",
+    "total_miss_type",
+    "total_miss",
+    "miss_delta_win_exp_impact",
+]
+_WORST_CALL_METRICS = ["total_miss", "miss_delta_win_exp_impact"]
+
+
+class UmpireScorecard:
+    """SQLite store of home plate umpire call aggregates, by umpire & date
+
+    Holds per-game totals (called pitches, misses, miss distance & win exp impact)
+    and each missed call, so scorecards, worst calls & trends are read from small
+    indexed tables instead of re-running umpire_calls over raw pitches
+    """
+
+    def __init__(self, path: str = _SCORECARD_PATH):
+        """Initialize Umpire Scorecard
+
+        Parameters
+        ----------
+            path (str, optional): str, default _SCORECARD_PATH
+                sqlite database file
+        """
+        self.path = pathlib.Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS games (
+                    umpire TEXT NOT NULL,
+                    game_date TEXT NOT NULL,
+                    game_pk INTEGER NOT NULL,
+                    called INTEGER NOT NULL,
+                    called_strikes INTEGER NOT NULL,
+                    missed INTEGER NOT NULL,
+                    missed_strikes INTEGER NOT NULL,
+                    missed_balls INTEGER NOT NULL,
+                    total_miss REAL NOT NULL,
+                    miss_delta_win_exp_impact REAL NOT NULL,
+                    PRIMARY KEY (umpire, game_date, game_pk)
+                );
+                CREATE TABLE IF NOT EXISTS missed_calls (
+                    pitch_id TEXT PRIMARY KEY,
+                    umpire TEXT NOT NULL,
+                    game_date TEXT NOT NULL,
+                    game_pk INTEGER NOT NULL,
+                    batter INTEGER,
+                    pitcher INTEGER,
+                    description TEXT,
+                    total_miss_type TEXT,
+                    total_miss REAL,
+                    miss_delta_win_exp_impact REAL
+                );
+                CREATE INDEX IF NOT EXISTS missed_calls_umpire
+                    ON missed_calls (umpire, game_date);
+                CREATE INDEX IF NOT EXISTS missed_calls_game
+                    ON missed_calls (game_pk);
+                """)
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """New connection (one per call)
+
+        Commits (or rolls back on error) & closes the connection on exit
+        """
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def fold(self, df: pd.DataFrame) -> int:
+        """Fold pitches into the scorecard
+
+        Games are replaced as a whole, so folding a game again (i.e. a re-pull of
+        the latest day) updates its totals instead of double counting
+
+        Parameters
+        ----------
+            df : pd.DataFrame
+                statcast pitches w/ `umpires_home_plate` (see Game) & pitch_id,
+                the umpire_calls outputs are calculated if missing
+
+        Returns
+        -------
+            int
+                games folded
+        """
+        df = df[df["description"].isin(_CALLED_DESCRIPTIONS)]
+        df = df[df[_UMPIRE_COL].notna()]
+        if df.empty:
+            logging.info("No called pitches w/ a home plate umpire to fold.")
+            return 0
+        if not set(_RETURN_COLS).issubset(df.columns):
+            df = pd.concat([df, calculate_misses(df)], axis=1)
+
+        df = pd.DataFrame(
+            {
+                "pitch_id": df["pitch_id"].astype(str),
+                "umpire": df[_UMPIRE_COL].astype(str),
+                "game_date": pd.to_datetime(df["game_date"]).dt.strftime("%Y-%m-%d"),
+                "game_pk": df["game_pk"].astype("int64"),
+                "batter": df.get("batter"),
+                "pitcher": df.get("pitcher"),
+                "description": df["description"].astype(str),
+                "total_miss_type": df["total_miss_type"],
+                "total_miss": df["total_miss"].astype("float64"),
+                "miss_delta_win_exp_impact": df["miss_delta_win_exp_impact"].astype(
+                    "float64"
+                ),
+            }
+        )
+        df["strike"] = df["description"] == "called_strike"
+        df["missed"] = df["total_miss"] > 0
+        games = (
+            df.assign(
+                missed_strike=df["missed"] & df["strike"],
+                missed_ball=df["missed"] & ~df["strike"],
+                total_miss=df["total_miss"].where(df["missed"], 0.00),
+                miss_delta_win_exp_impact=df["miss_delta_win_exp_impact"].where(
+                    df["missed"], 0.00
+                ),
+            )
+            .groupby(["umpire", "game_date", "game_pk"], as_index=False)
+            .agg(
+                called=("pitch_id", "size"),
+                called_strikes=("strike", "sum"),
+                missed=("missed", "sum"),
+                missed_strikes=("missed_strike", "sum"),
+                missed_balls=("missed_ball", "sum"),
+                total_miss=("total_miss", "sum"),
+                miss_delta_win_exp_impact=("miss_delta_win_exp_impact", "sum"),
+            )
+        )
+        missed = df.loc[df["missed"], _MISSED_CALL_COLS].astype(object)
+        missed = missed.where(missed.notna(), None)
+
+        game_pks = [(int(gpk),) for gpk in games["game_pk"].unique()]
+        with self._connect() as conn:
+            conn.executemany("DELETE FROM games WHERE game_pk = ?", game_pks)
+            conn.executemany("DELETE FROM missed_calls WHERE game_pk = ?", game_pks)
+            conn.executemany(
+                f"INSERT INTO games ({', '.join(games.columns)}) "
+                f"VALUES ({', '.join('?' * len(games.columns))})",
+                games.astype(object).itertuples(index=False, name=None),
+            )
+            conn.executemany(
+                f"INSERT OR REPLACE INTO missed_calls ({', '.join(_MISSED_CALL_COLS)}) "
+                f"VALUES ({', '.join('?' * len(_MISSED_CALL_COLS))})",
+                missed.itertuples(index=False, name=None),
+            )
+        logging.info(
+            f"Folded {len(game_pks)} game(s), {len(missed)} missed call(s) "
+            f"into umpire scorecard."
+        )
+        return len(game_pks)
+
+    @staticmethod
+    def _where(umpire: str, season: int, start: str, end: str) -> tuple:
+        """WHERE clause & params for the common filters"""
+        clauses, params = [], []
+        if umpire:
+            clauses.append("umpire = ?")
+            params.append(umpire)
+        if season:
+            start = max(start or "", f"{season}-01-01")
+            end = min(end or "9999", f"{season}-12-31")
+        if start:
+            clauses.append("game_date >= ?")
+            params.append(start)
+        if end:
+            clauses.append("game_date <= ?")
+            params.append(end)
+        return (f"WHERE {' AND '.join(clauses)}" if clauses else ""), params
+
+    def _read(self, sql: str, params: list) -> pd.DataFrame:
+        """Run a query into a dataframe"""
+        with self._connect() as conn:
+            return pd.read_sql_query(sql, conn, params=params)
+
+    def worst_calls(
+        self,
+        umpire: str = None,
+        season: int = None,
+        start: str = None,
+        end: str = None,
+        n: int = 20,
+        by: str = "total_miss",
+    ) -> pd.DataFrame:
+        """Worst Calls
+
+        i.e. worst 20 missed calls by an umpire this season
+
+        Parameters
+        ----------
+            umpire (str, optional): str, default None
+                umpire full name, all if None
+            season (int, optional): int, default None
+                season (year)
+            start (str, optional): str, default None
+                min game date (i.e. "2023-04-01")
+            end (str, optional): str, default None
+                max game date
+            n (int, optional): int, default 20
+                calls to return
+            by (str, optional): str, default "total_miss"
+                metric to rank by, one of _WORST_CALL_METRICS
+
+        Returns
+        -------
+            pd.DataFrame
+                missed calls, worst first
+        """
+        if by not in _WORST_CALL_METRICS:
+            raise Exception(f"Rank by must be one of: {', '.join(_WORST_CALL_METRICS)}")
+        where, params = self._where(umpire, season, start, end)
+        return self._read(
+            f"SELECT * FROM missed_calls {where} ORDER BY {by} DESC LIMIT ?",
+            params + [n],
+        )
+
+    def scorecards(
+        self, umpire: str = None, season: int = None, start: str = None, end: str = None
+    ) -> pd.DataFrame:
+        """Scorecards
+
+        Totals & accuracy per umpire
+
+        Parameters
+        ----------
+            umpire (str, optional): str, default None
+                umpire full name, all if None
+            season (int, optional): int, default None
+                season (year)
+            start (str, optional): str, default None
+                min game date (i.e. "2023-04-01")
+            end (str, optional): str, default None
+                max game date
+
+        Returns
+        -------
+            pd.DataFrame
+                one row per umpire, best accuracy first
+        """
+        where, params = self._where(umpire, season, start, end)
+        df = self._read(
+            f"SELECT umpire, COUNT(*) AS games, SUM(called) AS called, "
+            f"SUM(missed) AS missed, SUM(missed_strikes) AS missed_strikes, "
+            f"SUM(missed_balls) AS missed_balls, SUM(total_miss) AS total_miss, "
+            f"SUM(miss_delta_win_exp_impact) AS miss_delta_win_exp_impact "
+            f"FROM games {where} GROUP BY umpire",
+            params,
+        )
+        return self._with_accuracy(df).sort_values("accuracy", ascending=False)
+
+    def trend(
+        self, umpire: str = None, season: int = None, start: str = None, end: str = None
+    ) -> pd.DataFrame:
+        """Trend
+
+        Accuracy by week (starting Monday) per umpire
+
+        Parameters
+        ----------
+            umpire (str, optional): str, default None
+                umpire full name, all if None
+            season (int, optional): int, default None
+                season (year)
+            start (str, optional): str, default None
+                min game date (i.e. "2023-04-01")
+            end (str, optional): str, default None
+                max game date
+
+        Returns
+        -------
+            pd.DataFrame
+                one row per umpire & week
+        """
+        where, params = self._where(umpire, season, start, end)
+        df = self._read(
+            f"SELECT umpire, date(game_date, 'weekday 0', '-6 days') AS week, "
+            f"COUNT(*) AS games, SUM(called) AS called, SUM(missed) AS missed, "
+            f"SUM(total_miss) AS total_miss, "
+            f"SUM(miss_delta_win_exp_impact) AS miss_delta_win_exp_impact "
+            f"FROM games {where} GROUP BY umpire, week ORDER BY umpire, week",
+            params,
+        )
+        return self._with_accuracy(df)
+
+    @staticmethod
+    def _with_accuracy(df: pd.DataFrame) -> pd.DataFrame:
+        """Add accuracy (% of called pitches correct) & avg miss (inches)"""
+        df["accuracy"] = (100.00 * (1 - df["missed"] / df["called"])).round(2)
+        df["avg_miss"] = (df["total_miss"] / df["missed"]).round(2).fillna(0.00)
+        return df
+
+    def game_pks(self) -> list:
+        """Game pks folded in so far"""
+        with self._connect() as conn:
+            return [r[0] for r in conn.execute("SELECT DISTINCT game_pk FROM games")]
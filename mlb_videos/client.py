@@ -9,24 +9,38 @@ logger = logging.getLogger(__name__)
 
 from .constants import Teams
 from .statsapi import Game, Player
-from .statcast import Statcast, _DEFAULT_SORT
-from .filmroom import FilmRoom
+from .statcast import (
+    Statcast,
+    compact_df,
+    build_pitch_id,
+    statcast_filters,
+    _DEFAULT_SORT,
+    _REQUIRED_COLS,
+    _UNIQUE_IDENTIFIER_NAME,
+    _STORE_PATH,
+)
+from .cache.statcast_store import StatcastStore
+from .cache.umpire_scorecard import (
+    UmpireScorecard,
+    _SCORECARD_PATH,
+    _UMPIRE_COL,
+    _MISSED_CALL_COLS,
+)
+from .query import query_columns
+from .similarity import PitchIndex, _SIMILARITY_FEATURES
+from .planner import plan_pushdown, pushdown_queries
+from .filmroom import FilmRoom, _FILMROOM_PARAMETERS, _FILMROOM_DEFAULT_PARAMETERS
 from .compilation import Compilation
 from .youtube import YouTube
 
 from .utils import _PURGE_SUBFOLDERS
 from .utils import get_video_info
 
-from .analysis.umpire_calls import get_ump_calls
-from .analysis.delta_win_exp import get_pitcher_batter_delta_win_exp
-from .analysis.pitch_movement import get_pitch_movement
-
-
-_ANALYSIS_DICT = {
-    "umpire_calls": get_ump_calls,
-    "pitcher_batter_delta_win_exp": get_pitcher_batter_delta_win_exp,
-    "pitch_movement": get_pitch_movement,
-}
+from .analysis.registry import (
+    run_analysis,
+    analysis_inputs,
+    referenced_analysis,
+)
 
 
 class MLBVideoClient:
@@ -48,6 +62,9 @@ class MLBVideoClient:
         youtube_upload: bool = False,
         youtube_params: dict = {},
         purge_files: bool = False,
+        compact: bool = False,
+        pushdown: bool = False,
+        umpire_scorecard: bool = False,
     ):
         """MLB Video Client - handles end-to-end
 
@@ -72,11 +89,14 @@ class MLBVideoClient:
             analysis (list, optional): list, default None
                 List of analysis functions to apply, transforming dataframe
                     ex. `["umpire_calls","pitch_movement"]`
+                See analysis.registry._ANALYSIS_REGISTRY -- independent analyses
+                run together, each on its own input columns
             queries (list, optional): list, default None
                 List of queries to apply to dataframe
                     Each row represents string passed to df.query method
             steps (list, optional): list, default None
                 Each element `step` in steps represents a query or rank method applied
+                    (also sort, or similar -- top-k most similar pitches, see similar_df)
             search_filmroom (bool, optional): bool, default False
                 Perform search on MLB Film Room site, finding video for each record in dataframe
             filmroom_params (dict, optional): dict, default {}
@@ -92,6 +112,19 @@ class MLBVideoClient:
                     ex. video title, description, tags, playlist to add to, privacy, thumbnail, etc.
             purge_files (bool, optional): bool, default False
                 Purge local store of video clips, compilations, etc.
+            compact (bool, optional): bool, default False
+                Keep only the statcast columns used by the configured analysis, queries,
+                steps, filmroom search & compilation -- with categoricals & downcast numerics
+                Analyses whose outputs are never referenced downstream are skipped
+            pushdown (bool, optional): bool, default False
+                Send filters in queries (& query steps before any rank/similar step) to Savant
+                as statcast params where supported -- pitch type, event, description,
+                team, inning, count. The queries are still applied locally.
+                Opt-in: self.df (& data saved w/ save_local/incremental, keyed by the
+                pushed params) then only holds pitches the queries can match
+            umpire_scorecard (bool, optional): bool, default False
+                Fold the pitches into the umpire scorecard store (before queries),
+                see update_umpire_scorecard -- queries are not pushed down
         """
         self.project_name = project_name
         self.local_path = project_path
@@ -110,7 +143,12 @@ class MLBVideoClient:
         self.youtube_upload = youtube_upload
         self.youtube_params = youtube_params
         self.purge_files = purge_files
+        self.compact = compact
+        self.pushdown = pushdown
+        self.umpire_scorecard = umpire_scorecard
         self.missing_videos = []
+        self.similarity_indexes = {}
+        self.df_filtered = False
 
         if self.statcast_params:
             self.get_statcast_df()
@@ -122,8 +160,9 @@ class MLBVideoClient:
             if team_info:
                 self.add_team_info()
             if analysis:
-                for mod in self.analysis:
-                    self.transform_statcast(mod)
+                self.transform_statcast(self._active_analysis())
+            if umpire_scorecard:
+                self.update_umpire_scorecard()
 
             if queries:
                 self._perform_queries()
@@ -148,7 +187,7 @@ class MLBVideoClient:
             )
             pass
 
-    def get_statcast_df(self, statcast_params: dict = None):
+    def get_statcast_df(self, statcast_params: dict = None, compact: bool = None):
         """Get Statcast DF
 
         Parameters
@@ -156,6 +195,8 @@ class MLBVideoClient:
             statcast_params (dict, optional): dict, default None
                 dictionary of new statcast params to set
                 if none, will use self.statcast_params?
+            compact (bool, optional): bool, default None
+                compact the statcast df (see self.compact), defaults to self.compact
         """
         if not statcast_params and self.statcast_params:
             statcast_params = self.statcast_params
@@ -165,7 +206,115 @@ class MLBVideoClient:
             logging.info(f"No statcast params -- try again.")
             return
 
-        self.df = Statcast(**self.statcast_params).get_df()
+        if compact is not None:
+            self.compact = compact
+
+        if self.pushdown and self.umpire_scorecard:
+            logging.info(f"Umpire scorecard needs full games -- skipping pushdown.")
+        elif self.pushdown:
+            statcast_params = plan_pushdown(
+                pushdown_queries(self.queries, self.steps), self.statcast_params
+            )
+        self.df = Statcast(**statcast_params).get_df()
+        # A team filter still returns whole games
+        self.df_filtered = bool(set(statcast_filters(statcast_params)) - {"teams"})
+        if self.compact and self.df is not None:
+            self.df = compact_df(self.df, columns=self._required_columns())
+
+    def query_store(
+        self,
+        queries: Union[list, str] = None,
+        statcast_params: dict = None,
+        columns: list = None,
+        store_path: str = _STORE_PATH,
+    ):
+        """Query the local Statcast store (instead of the Statcast API)
+
+        Sets self.df to the stored pitches matching the queries, reading only the
+        partitions/rows the queries can match (see StatcastStore.query)
+        Data must have been saved w/ save_local or incremental statcast params
+
+        Parameters
+        ----------
+            queries (Union[list, str], optional): Union[list, str], default None
+                query string(s) to apply, defaults to self.queries
+                    ex. "events == 'home_run' and game_year == 2023"
+            statcast_params (dict, optional): dict, default None
+                statcast params the data was saved with (filters select the stored set),
+                defaults to self.statcast_params
+            columns (list, optional): list, default None
+                columns to read (plus the sort/identifier columns & those the queries
+                reference), all if None
+            store_path (str, optional): str, default _STORE_PATH
+                root folder of the statcast store
+        """
+        queries = queries if queries is not None else self.queries
+        filters = statcast_filters(statcast_params or self.statcast_params or {})
+        if columns:
+            columns = list(dict.fromkeys(_REQUIRED_COLS + list(columns)))
+        self.df = StatcastStore(store_path).query(filters, queries, columns)
+        self.df_filtered = bool(set(filters) - {"teams"} or queries)
+        if not self.df.empty:
+            self.df[_UNIQUE_IDENTIFIER_NAME] = build_pitch_id(self.df)
+        logging.info(f"Queried statcast store: {len(self.df)} rows")
+
+    def _required_columns(self) -> list:
+        """Statcast columns required downstream
+
+        Based on the configured analysis (inputs), queries & steps (referenced names),
+        info merges, filmroom search params & compilation caption
+
+        Returns
+        -------
+            list
+                column names
+        """
+        cols = self._referenced_columns()
+        if self.player_info:
+            cols += ["batter", "pitcher"]
+        if self.team_info:
+            cols += ["home_team", "away_team"]
+        cols += analysis_inputs(self._active_analysis())
+        if self.umpire_scorecard:
+            cols += analysis_inputs(["umpire_calls"]) + ["batter", "pitcher"]
+        return list(dict.fromkeys(cols))
+
+    def _referenced_columns(self) -> list:
+        """Columns referenced by name downstream
+
+        Queries & steps, filmroom search params & compilation caption
+
+        Returns
+        -------
+            list
+                column names
+        """
+        cols = _REQUIRED_COLS + [_UNIQUE_IDENTIFIER_NAME]
+        texts = list(self.queries or [])
+        for step in self.steps or []:
+            for v in (step.get("params") or {}).values():
+                texts += v if isinstance(v, list) else [v]
+            if step.get("type") == "similar" and not (step.get("params") or {}).get(
+                "features"
+            ):
+                cols += _SIMILARITY_FEATURES
+        for text in texts:
+            if isinstance(text, str):
+                cols += query_columns(text)
+
+        query_params = (self.filmroom_params or {}).get(
+            "query_params", _FILMROOM_DEFAULT_PARAMETERS
+        )
+        cols += [
+            p.get("Ref")
+            for p in _FILMROOM_PARAMETERS
+            if p.get("Name") in query_params and p.get("Ref")
+        ]
+        if (self.compilation_params or {}).get("metric_caption"):
+            cols.append(self.compilation_params.get("metric_caption"))
+        if self.umpire_scorecard:
+            cols += _MISSED_CALL_COLS
+        return list(dict.fromkeys(cols))
 
     def purge_project_media(self):
         """Deletes local store of media files (video, data, etc.)"""
@@ -190,7 +339,7 @@ class MLBVideoClient:
 
         Contains attributes for ballpark, umpire, etc.
         """
-        game_list = list(set(self.statcast_df["game_pk"].values.tolist()))
+        game_list = list(set(self.df["game_pk"].values.tolist()))
         logging.info(f"Getting game info for {len(game_list)} game(s)..")
         games = Game(game_list)
         game_df = games.get_df()
@@ -234,6 +383,38 @@ class MLBVideoClient:
         )
         logging.info(f"Added player info.")
 
+    def update_umpire_scorecard(self, path: str = _SCORECARD_PATH) -> UmpireScorecard:
+        """Fold the statcast dataframe into the umpire scorecard store
+
+        Must run on the full pitches of each game (before queries/steps), as each
+        game folded replaces its previous totals. Game info is added if missing.
+
+        Parameters
+        ----------
+            path (str, optional): str, default _SCORECARD_PATH
+                sqlite database file
+
+        Returns
+        -------
+            UmpireScorecard
+                store to query (worst_calls, scorecards, trend)
+
+        Raises
+        ------
+            Exception
+                If self.df is filtered (statcast filter params, queries or steps)
+        """
+        if self.df_filtered:
+            raise Exception(
+                "Umpire scorecard needs the full pitches of each game -- "
+                "fold before queries/steps & w/o statcast filter params."
+            )
+        if _UMPIRE_COL not in self.df.columns:
+            self.add_game_info()
+        scorecard = UmpireScorecard(path)
+        scorecard.fold(self.df)
+        return scorecard
+
     def add_team_info(self):
         """Add team info from static file to statcast dataframe
 
@@ -261,9 +442,28 @@ class MLBVideoClient:
             on="away_team",
         )
 
+    def _active_analysis(self) -> list:
+        """Configured analyses to run
+
+        In compact mode, analyses whose outputs are never referenced downstream
+        are skipped (their outputs would be unused)
+
+        Returns
+        -------
+            list
+                analysis names
+        """
+        analysis = list(self.analysis or [])
+        if not self.compact:
+            return analysis
+        return referenced_analysis(analysis, self._referenced_columns())
+
     def transform_statcast(self, mod: Union[list, str]):
         """Run each module `(analysis/*)` referenced in class.analysis
 
+        Each analysis reads only its input columns (see _ANALYSIS_REGISTRY),
+        independent analyses run in parallel on large frames
+
         Parameters
         ----------
             mod : Union[list, str]
@@ -271,9 +471,8 @@ class MLBVideoClient:
         """
         if isinstance(mod, str):
             mod = [mod]
-        for md in mod:
-            self.df = _ANALYSIS_DICT.get(md)(self.df)
-            logging.info(f"Transformed DF: {md}")
+        if mod:
+            self.df = run_analysis(self.df, mod)
 
     def _perform_filmroom_search(self, pitch: pd.Series, params: dict) -> Tuple:
         """Performs a filmrooom search for given pitch
@@ -369,8 +568,90 @@ class MLBVideoClient:
         """
         self.df = self.df.query(query)
         self.df = self.df.reset_index(drop=True)
+        self.df_filtered = True
         logging.info(f"Applied query to DF: {query}")
 
+    def similar_df(
+        self,
+        k: int = 20,
+        pitch_id: str = None,
+        query: str = None,
+        features: list = None,
+        index_path: str = None,
+        name: str = "similarity_rank",
+        include_reference: bool = False,
+    ):
+        """Keep the k pitches most similar to a reference pitch (nearest neighbors)
+
+        Ex. pitches most like a given slider -- the reference is a pitch_id, or the
+        average of the pitches matching a query (i.e. a pitcher's average slider)
+        Adds `similarity_distance` & a rank field, sorted most similar first
+
+        Parameters
+        ----------
+            k (int, optional): int, default 20
+                pitches to keep
+            pitch_id (str, optional): str, default None
+                reference pitch (in self.df or the index)
+            query (str, optional): str, default None
+                reference = average features of the self.df pitches matching query
+            features (list, optional): list, default None
+                columns compared, defaults to _SIMILARITY_FEATURES
+                (ignored w/ index_path -- the persisted index's features are used)
+            index_path (str, optional): str, default None
+                persisted PitchIndex (see PitchIndex.from_store / save) to search,
+                otherwise an index is built over self.df
+            name (str, optional): str, default "similarity_rank"
+                name of rank field
+            include_reference (bool, optional): bool, default False
+                keep the reference pitch itself
+
+        Raises
+        ------
+            Exception
+                If no reference pitch / query match is found
+        """
+        if index_path:
+            if index_path not in self.similarity_indexes:
+                self.similarity_indexes[index_path] = PitchIndex.load(index_path)
+            index = self.similarity_indexes.get(index_path)
+            candidates = self.df[_UNIQUE_IDENTIFIER_NAME]
+        else:
+            index = PitchIndex(self.df, features or _SIMILARITY_FEATURES)
+            candidates = None
+
+        exclude = set()
+        values = None
+        if pitch_id is not None:
+            ref = self.df[self.df[_UNIQUE_IDENTIFIER_NAME].astype(str) == str(pitch_id)]
+            ref = ref[index.features].apply(pd.to_numeric, errors="coerce")
+            values = ref.mean().to_numpy() if len(ref) else index.vector(pitch_id)
+            if not include_reference:
+                exclude.add(str(pitch_id))
+        elif query:
+            ref = self.df.query(query)[index.features]
+            if len(ref):
+                values = ref.apply(pd.to_numeric, errors="coerce").mean().to_numpy()
+        if values is None or pd.isnull(values).any():
+            raise Exception(
+                f"No reference pitch w/ {', '.join(index.features)} found "
+                f"(pitch_id={pitch_id}, query={query})"
+            )
+
+        matches = index.query(values, k=k, candidates=candidates, exclude=exclude)
+        self.df = self.df[
+            self.df[_UNIQUE_IDENTIFIER_NAME]
+            .astype(str)
+            .isin(matches[_UNIQUE_IDENTIFIER_NAME])
+        ]
+        self.df = self.df.merge(
+            matches, how="inner", on=_UNIQUE_IDENTIFIER_NAME
+        ).sort_values("similarity_distance", kind="stable")
+        self.df[name] = range(1, len(self.df) + 1)
+        self.df = self.df.reset_index(drop=True)
+        self.df_filtered = True
+        logging.info(f"Kept {len(self.df)} most similar pitch(es), rank field: {name}")
+
     def rank_df(
         self,
         name: str,
@@ -449,6 +730,8 @@ class MLBVideoClient:
                 self.rank_df(**step.get("params"))
             elif step.get("type") == "sort":
                 self.sort_df(**step.get("params"))
+            elif step.get("type") == "similar":
+                self.similar_df(**step.get("params"))
         self.df = self.df.reset_index(drop=True)
 
     def create_compilation(self):
@@ -82,6 +82,125 @@ _PITCH_TYPES = {
     "FO": {"Name": "Forkball", "Group": "Offspeed"},
 }
 
+_STATCAST_DATE_COLS = {"game_date": _DT_FORMAT}
+
+_STATCAST_SCHEMA = {
+    "pitch_type": "category",
+    "release_speed": "float64",
+    "release_pos_x": "float64",
+    "release_pos_z": "float64",
+    "player_name": "object",
+    "batter": "Int64",
+    "pitcher": "Int64",
+    "events": "category",
+    "description": "category",
+    "spin_dir": "float64",
+    "spin_rate_deprecated": "float64",
+    "break_angle_deprecated": "float64",
+    "break_length_deprecated": "float64",
+    "zone": "Int64",
+    "des": "object",
+    "game_type": "category",
+    "stand": "category",
+    "p_throws": "category",
+    "home_team": "category",
+    "away_team": "category",
+    "type": "category",
+    "hit_location": "Int64",
+    "bb_type": "category",
+    "balls": "Int64",
+    "strikes": "Int64",
+    "game_year": "Int64",
+    "pfx_x": "float64",
+    "pfx_z": "float64",
+    "plate_x": "float64",
+    "plate_z": "float64",
+    "on_3b": "Int64",
+    "on_2b": "Int64",
+    "on_1b": "Int64",
+    "outs_when_up": "Int64",
+    "inning": "Int64",
+    "inning_topbot": "category",
+    "hc_x": "float64",
+    "hc_y": "float64",
+    "tfs_deprecated": "object",
+    "tfs_zulu_deprecated": "object",
+    "fielder_2": "Int64",
+    "umpire": "float64",
+    "sv_id": "object",
+    "vx0": "float64",
+    "vy0": "float64",
+    "vz0": "float64",
+    "ax": "float64",
+    "ay": "float64",
+    "az": "float64",
+    "sz_top": "float64",
+    "sz_bot": "float64",
+    "hit_distance_sc": "float64",
+    "launch_speed": "float64",
+    "launch_angle": "float64",
+    "effective_speed": "float64",
+    "release_spin_rate": "float64",
+    "release_extension": "float64",
+    "game_pk": "Int64",
+    "pitcher.1": "Int64",
+    "fielder_2.1": "Int64",
+    "fielder_3": "Int64",
+    "fielder_4": "Int64",
+    "fielder_5": "Int64",
+    "fielder_6": "Int64",
+    "fielder_7": "Int64",
+    "fielder_8": "Int64",
+    "fielder_9": "Int64",
+    "release_pos_y": "float64",
+    "estimated_ba_using_speedangle": "float64",
+    "estimated_woba_using_speedangle": "float64",
+    "estimated_slg_using_speedangle": "float64",
+    "woba_value": "float64",
+    "woba_denom": "float64",
+    "babip_value": "float64",
+    "iso_value": "float64",
+    "launch_speed_angle": "Int64",
+    "at_bat_number": "Int64",
+    "pitch_number": "Int64",
+    "pitch_name": "category",
+    "home_score": "Int64",
+    "away_score": "Int64",
+    "bat_score": "Int64",
+    "fld_score": "Int64",
+    "post_away_score": "Int64",
+    "post_home_score": "Int64",
+    "post_bat_score": "Int64",
+    "post_fld_score": "Int64",
+    "if_fielding_alignment": "category",
+    "of_fielding_alignment": "category",
+    "spin_axis": "float64",
+    "delta_home_win_exp": "float64",
+    "delta_run_exp": "float64",
+    "delta_pitcher_run_exp": "float64",
+    "bat_speed": "float64",
+    "swing_length": "float64",
+    "hyper_speed": "float64",
+    "home_score_diff": "Int64",
+    "bat_score_diff": "Int64",
+    "home_win_exp": "float64",
+    "bat_win_exp": "float64",
+    "age_pit_legacy": "Int64",
+    "age_bat_legacy": "Int64",
+    "age_pit": "Int64",
+    "age_bat": "Int64",
+    "n_thruorder_pitcher": "Int64",
+    "n_priorpa_thisgame_player_at_bat": "Int64",
+    "pitcher_days_since_prev_game": "Int64",
+    "batter_days_since_prev_game": "Int64",
+    "pitcher_days_until_next_game": "Int64",
+    "batter_days_until_next_game": "Int64",
+    "api_break_z_with_gravity": "float64",
+    "api_break_x_arm": "float64",
+    "api_break_x_batter_in": "float64",
+    "arm_angle": "float64",
+}
+
 Teams = {
     "ARI": {
         "name": "Arizona Diamondbacks",
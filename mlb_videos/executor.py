@@ -0,0 +1,187 @@
+import json
+import asyncio
+import requests
+from tqdm import tqdm
+import concurrent.futures
+
+from .session import (
+    get_session,
+    get_with_retry,
+    get_with_retry_async,
+    aiohttp,
+    RateLimiter,
+    _DEFAULT_TIMEOUT,
+)
+
+import logging
+import logging.config
+
+logger = logging.getLogger(__name__)
+
+_CONCURRENT_THRESHOLD = 10
+_ASYNC_THRESHOLD = 200
+_MAX_WORKERS = 16
+_MAX_IN_FLIGHT = 64
+
+
+class FetchExecutor:
+    """Runs many fetches -- serially, on a bounded thread pool, or on an event loop"""
+
+    def __init__(
+        self,
+        session: requests.Session = None,
+        max_workers: int = _MAX_WORKERS,
+        max_in_flight: int = _MAX_IN_FLIGHT,
+        threshold: int = _CONCURRENT_THRESHOLD,
+        async_threshold: int = _ASYNC_THRESHOLD,
+        limiter: RateLimiter = None,
+    ):
+        """Initialize Fetch Executor
+
+        Execution mode is picked per call from the number of items:
+            fewer than threshold -> serial
+            fewer than async_threshold (or aiohttp not installed) -> threads
+            otherwise -> async (JSON requests only)
+
+        Parameters
+        ----------
+            session (requests.Session, optional): requests.Session, default None
+                HTTP session to use, defaults to the shared pooled session
+            max_workers (int, optional): int, default _MAX_WORKERS
+                max threads
+            max_in_flight (int, optional): int, default _MAX_IN_FLIGHT
+                max concurrent requests in async mode
+            threshold (int, optional): int, default _CONCURRENT_THRESHOLD
+                min items to run concurrently
+            async_threshold (int, optional): int, default _ASYNC_THRESHOLD
+                min items to run on an event loop
+            limiter (RateLimiter, optional): RateLimiter, default None
+                rate limiter applied to every request
+        """
+        self.session = session if session else get_session()
+        self.max_workers = max_workers
+        self.max_in_flight = max_in_flight
+        self.threshold = threshold
+        self.async_threshold = async_threshold
+        self.limiter = limiter
+        self.errors = {}
+
+    def mode(self, n: int, async_ok: bool = False) -> str:
+        """Execution mode for n items
+
+        Parameters
+        ----------
+            n : int
+                number of items
+            async_ok (bool, optional): bool, default False
+                whether the work can run on an event loop
+
+        Returns
+        -------
+            str
+                "serial", "threads" or "async"
+        """
+        if n < self.threshold:
+            return "serial"
+        if async_ok and n >= self.async_threshold and aiohttp is not None:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return "async"
+        return "threads"
+
+    def map(self, func, items: list) -> dict:
+        """Apply func to each item (serially or on the thread pool)
+
+        An item that raises is logged & recorded in self.errors, the rest continue
+
+        Parameters
+        ----------
+            func : callable
+                func(item) -> result
+            items : list
+                items to fetch
+
+        Returns
+        -------
+            dict
+                item -> result, in item order (failed items excluded)
+        """
+        results = {}
+        mode = self.mode(len(items))
+        logging.info(f"Fetching {len(items)} item(s) ({mode})..")
+        if mode == "serial":
+            for item in items:
+                try:
+                    results[item] = func(item)
+                except Exception as e:
+                    self._record_error(item, e)
+            return results
+
+        with tqdm(total=len(items)) as progress:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(items))
+            ) as executor:
+                futures = {executor.submit(func, item): item for item in items}
+                for future in concurrent.futures.as_completed(futures):
+                    try:
+                        results[futures[future]] = future.result()
+                    except Exception as e:
+                        self._record_error(futures[future], e)
+                    progress.update(1)
+        return {item: results[item] for item in items if item in results}
+
+    def get_json(self, items: dict) -> dict:
+        """GET many JSON documents
+
+        Parameters
+        ----------
+            items : dict
+                key -> (url, params)
+
+        Returns
+        -------
+            dict
+                key -> parsed JSON, in key order (failed keys excluded)
+        """
+        if self.mode(len(items), async_ok=True) == "async":
+            logging.info(f"Fetching {len(items)} item(s) (async)..")
+            results = asyncio.run(self._get_json_async(items))
+            return {k: results[k] for k in items if k in results}
+
+        def _get(key):
+            url, params = items.get(key)
+            return get_with_retry(
+                self.session, url, limiter=self.limiter, params=params
+            ).json()
+
+        return self.map(_get, list(items))
+
+    async def _get_json_async(self, items: dict) -> dict:
+        """GET many JSON documents on the event loop"""
+        results = {}
+        semaphore = asyncio.Semaphore(self.max_in_flight)
+        timeout = aiohttp.ClientTimeout(
+            sock_connect=_DEFAULT_TIMEOUT[0], sock_read=_DEFAULT_TIMEOUT[1]
+        )
+
+        async def _get(http, key):
+            url, params = items.get(key)
+            try:
+                content = await get_with_retry_async(
+                    http, url, limiter=self.limiter, semaphore=semaphore, params=params
+                )
+                results[key] = json.loads(content)
+            except Exception as e:
+                self._record_error(key, e)
+
+        async with aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.max_in_flight), timeout=timeout
+        ) as http:
+            await asyncio.gather(*[_get(http, key) for key in items])
+        return results
+
+    def _record_error(self, item, e: Exception) -> None:
+        """Record a failed item"""
+        logging.error(f"Fetch failed for {item}: {e}")
+        self.errors[item] = str(e)
@@ -9,6 +9,7 @@ import logging.config
 logger = logging.getLogger(__name__)
 
 from .constants import _DT_FORMAT, _FILMROOM_QUERIES
+from .session import get_session, get_with_retry
 
 
 _FILMROOM_CHUNK_SIZE = 1024
@@ -221,6 +222,7 @@ class FilmRoom:
         query_params: list = _FILMROOM_DEFAULT_PARAMETERS,
         feed: str = _FILMROOM_DEFAULT_FEED,
         download: bool = _FILMROOM_DEFAULT_DOWNLOAD,
+        session: requests.Session = None,
     ):
         """_summary_
 
@@ -236,7 +238,10 @@ class FilmRoom:
                 feed priority/selection -- links to _FILMROOM_FEED_TYPES
             download (bool, optional): bool, default _FILMROOM_DEFAULT_DOWNLOAD
                 whether to download search results or not
+            session (requests.Session, optional): requests.Session, default None
+                HTTP session to use, defaults to the shared pooled session
         """
+        self.session = session if session else get_session()
         self.pitch = pitch
         self.query_params = query_params
         self.feed = _FILMROOM_FEED_TYPES.get(_FILMROOM_DEFAULT_FEED, "Optimal")
@@ -322,7 +327,10 @@ class FilmRoom:
         """
         headers = _FILMROOM_HEADERS.get(request_type)
         resp_path = _FILMROOM_RESPONSE_PATH.get(request_type)
-        resp = requests.get(url, headers=headers)
+        try:
+            resp = get_with_retry(self.session, url, headers=headers, stream=download)
+        except requests.HTTPError as e:
+            resp = e.response
         if resp.status_code != 200:
             raise Exception(
                 f"Bad Request, Status Code: {resp.status_code}: {resp.text}"
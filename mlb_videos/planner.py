@@ -0,0 +1,252 @@
+import math
+from datetime import datetime, timedelta
+
+from .constants import _DT_FORMAT
+from .query import parse_predicates
+
+import logging
+import logging.config
+
+logger = logging.getLogger(__name__)
+
+_SAVANT_ROW_CAP = 25000
+_ROWS_PER_DAY = 4500
+_CHUNK_FILL = 0.5
+_MAX_CHUNK_DAYS = 60
+
+_FILTER_SELECTIVITY = {
+    "pitchers": 0.005,
+    "batters": 0.004,
+    "teams": 0.067,
+    "pitch_types": 0.15,
+    "events": 0.025,
+    "descriptions": 0.2,
+    "innings": 0.11,
+    "counts": 0.08,
+}
+_PUSHDOWN_COLUMNS = {
+    "pitch_type": "pitch_types",
+    "events": "events",
+    "description": "descriptions",
+    "home_team": "teams",
+    "away_team": "teams",
+    "inning": "innings",
+}
+_PUSHDOWN_INNINGS = list(range(1, 10))
+_PUSHDOWN_BALLS = list(range(0, 4))
+_PUSHDOWN_STRIKES = list(range(0, 3))
+_EVENT_SELECTIVITY = {
+    "home run": 0.008,
+    "strikeout": 0.06,
+    "walk": 0.022,
+    "single": 0.036,
+    "double": 0.011,
+    "triple": 0.001,
+    "field out": 0.1,
+    "grounded into double play": 0.005,
+}
+
+
+def estimate_rows_per_day(filters: dict) -> float:
+    """Estimate Rows per Day
+
+    Estimates the pitches returned per day for a set of statcast filters,
+    starting from a full slate of games & multiplying the selectivity of each filter
+    (values within a filter are OR'd, so their selectivities are summed)
+
+    Parameters
+    ----------
+        filters : dict
+            statcast filter params (pitch_types, events, etc.)
+
+    Returns
+    -------
+        float
+            estimated rows per day
+    """
+    rows = float(_ROWS_PER_DAY)
+    for arg, values in filters.items():
+        if not values or arg not in _FILTER_SELECTIVITY:
+            continue
+        if arg == "events":
+            selectivity = sum(
+                _EVENT_SELECTIVITY.get(
+                    str(v).lower().replace("_", " "), _FILTER_SELECTIVITY.get(arg)
+                )
+                for v in values
+            )
+        else:
+            selectivity = _FILTER_SELECTIVITY.get(arg) * len(values)
+        rows *= min(selectivity, 1.0)
+    return rows
+
+
+def chunk_days(rows_per_day: float, row_cap: int = _SAVANT_ROW_CAP) -> int:
+    """Chunk Days
+
+    Largest number of days per request expected to stay under the row cap,
+    filling only _CHUNK_FILL of the cap to leave headroom for busy days
+
+    Parameters
+    ----------
+        rows_per_day : float
+            estimated rows per day
+        row_cap (int, optional): int, default _SAVANT_ROW_CAP
+            max rows Savant returns per request
+
+    Returns
+    -------
+        int
+            days per chunk
+    """
+    if rows_per_day <= 0:
+        return _MAX_CHUNK_DAYS
+    return max(
+        1, min(_MAX_CHUNK_DAYS, math.floor(row_cap * _CHUNK_FILL / rows_per_day))
+    )
+
+
+def plan_chunks(dates: list, days: int) -> list:
+    """Plan Chunks
+
+    Groups consecutive dates into chunks of up to `days` dates,
+    a gap in the dates (i.e. off-season) always starts a new chunk
+
+    Parameters
+    ----------
+        dates : list
+            sorted list of dates (str)
+        days : int
+            max dates per chunk
+
+    Returns
+    -------
+        list
+            list of chunks (list of dates)
+    """
+    chunks = []
+    for dt in dates:
+        if chunks and len(chunks[-1]) < days and next_day(chunks[-1][-1]) == dt:
+            chunks[-1].append(dt)
+        else:
+            chunks.append([dt])
+    return chunks
+
+
+def next_day(dt: str) -> str:
+    """Next Day
+
+    Parameters
+    ----------
+        dt : str
+            date (i.e. "2023-09-01")
+
+    Returns
+    -------
+        str
+            following date (i.e. "2023-09-02")
+    """
+    return (datetime.strptime(dt, _DT_FORMAT) + timedelta(days=1)).strftime(_DT_FORMAT)
+
+
+def pushdown_queries(queries: list = None, steps: list = None) -> list:
+    """Pushdown Queries
+
+    Queries that filter the statcast data before anything depends on the full set --
+    all client queries, plus query steps before the first rank/similar step
+
+    Parameters
+    ----------
+        queries (list, optional): list, default None
+            client queries (df.query strings)
+        steps (list, optional): list, default None
+            client steps
+
+    Returns
+    -------
+        list
+            query strings
+    """
+    pushable = list(queries or [])
+    for step in steps or []:
+        if step.get("type") in ["rank", "similar"]:
+            break
+        if step.get("type") == "query":
+            pushable.append(step.get("params", {}).get("query"))
+    return [q for q in pushable if isinstance(q, str)]
+
+
+def _pushdown_value(arg: str, value):
+    """Statcast param value for a query value, None if it can't be pushed"""
+    if not isinstance(value, (str, int)) or isinstance(value, bool):
+        return None
+    if arg == "pitch_types":
+        return str(value).upper()
+    elif arg in ["events", "descriptions"]:
+        return str(value).replace("_", " ")
+    elif arg == "teams":
+        return str(value).upper()
+    elif arg == "innings":
+        return int(value) if value in _PUSHDOWN_INNINGS else None
+    return None
+
+
+def plan_pushdown(queries: list, params: dict) -> dict:
+    """Plan Pushdown
+
+    Turns equality/membership predicates in the queries (see parse_predicates) into
+    statcast params, so Savant filters server-side (hfPT, hfAB, hfPR, hfTeam, hfInn, hfC)
+    Server-side filters only need to return a superset of the query results --
+    the queries are still applied locally afterwards.
+    Params already set are narrowed to the values the queries allow.
+
+    Parameters
+    ----------
+        queries : list
+            query strings that can be pushed (see pushdown_queries)
+        params : dict
+            statcast params
+
+    Returns
+    -------
+        dict
+            statcast params w/ pushed filters added
+    """
+    allowed = {}
+    for query in queries:
+        for col, op, value in parse_predicates(query):
+            if op not in ["==", "in"]:
+                continue
+            values = set(value) if isinstance(value, list) else {value}
+            allowed[col] = allowed[col] & values if col in allowed else values
+
+    pushed = {}
+    for col, arg in _PUSHDOWN_COLUMNS.items():
+        if col not in allowed:
+            continue
+        values = [_pushdown_value(arg, v) for v in allowed.get(col)]
+        if not values or None in values:
+            continue
+        # home & away team filters are both pushed as teams (either team matches)
+        pushed[arg] = sorted(set(pushed.get(arg, [])) | set(values), key=str)
+
+    if "balls" in allowed and "strikes" in allowed:
+        balls, strikes = allowed.get("balls"), allowed.get("strikes")
+        if balls <= set(_PUSHDOWN_BALLS) and strikes <= set(_PUSHDOWN_STRIKES):
+            pushed["counts"] = [
+                f"{b}{s}" for b in sorted(balls) for s in sorted(strikes)
+            ]
+
+    params = dict(params)
+    for arg, values in pushed.items():
+        current = params.get(arg)
+        if current:
+            current = current if isinstance(current, list) else [current]
+            values = [
+                v for v in values if str(v).upper() in [str(c).upper() for c in current]
+            ]
+            if not values:
+                continue
+        params[arg] = values
+        logging.info(f"Pushed query filter to statcast params: {arg}={values}")
+    return params
@@ -0,0 +1,215 @@
+import re
+import ast
+import operator
+import pandas as pd
+
+import logging
+import logging.config
+
+logger = logging.getLogger(__name__)
+
+_QUERY_LITERAL_REGEX = re.compile(r"(\"[^\"]*\"|'[^']*')")
+_QUERY_TOKEN_REGEX = re.compile(r"`([^`]+)`|([@.]?)\b([A-Za-z_][A-Za-z0-9_]*)\b")
+_QUERY_KEYWORDS = ["and", "or", "not", "in", "is", "True", "False", "None"]
+_QUERY_OPERATORS = {"&": " and ", "|": " or ", "~": " not ", "@": "__at_"}
+
+_COMPARE_OPS = {
+    ast.Eq: "==",
+    ast.NotEq: "!=",
+    ast.Lt: "<",
+    ast.LtE: "<=",
+    ast.Gt: ">",
+    ast.GtE: ">=",
+    ast.In: "in",
+    ast.NotIn: "not in",
+}
+_FLIPPED_OPS = {"==": "==", "!=": "!=", "<": ">", "<=": ">=", ">": "<", ">=": "<="}
+_OP_FUNCS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda a, b: a in b,
+    "not in": lambda a, b: a not in b,
+}
+_PARTITION_COLS = ["game_date", "game_year"]
+
+
+def query_columns(query: str) -> list:
+    """Query Columns
+
+    Column names referenced by a df.query string (or a plain column name)
+
+    Parameters
+    ----------
+        query : str
+            query string, i.e. "events == 'home_run' and `launch_speed` > 100"
+
+    Returns
+    -------
+        list
+            column names, in order of appearance
+            (excludes keywords, @variables & method names)
+    """
+    cols = []
+    for quoted, at, name in _QUERY_TOKEN_REGEX.findall(
+        _QUERY_LITERAL_REGEX.sub("", query)
+    ):
+        if quoted:
+            cols.append(quoted)
+        elif not at and name not in _QUERY_KEYWORDS:
+            cols.append(name)
+    return list(dict.fromkeys(cols))
+
+
+def _to_python(query: str) -> tuple:
+    """Rewrite a df.query string as a python expression
+
+    & | ~ become and/or/not (pandas gives them lower precedence than comparisons),
+    backtick-quoted names & @variables become placeholders
+
+    Returns
+    -------
+        tuple
+            (expression, placeholder -> column name)
+    """
+    names = {}
+
+    def _placeholder(m):
+        key = f"__col{len(names)}"
+        names[key] = m.group(1)
+        return key
+
+    parts = _QUERY_LITERAL_REGEX.split(query)
+    for i in range(0, len(parts), 2):
+        part = re.sub(r"`([^`]+)`", _placeholder, parts[i])
+        for op, repl in _QUERY_OPERATORS.items():
+            part = part.replace(op, repl)
+        parts[i] = part
+    return "".join(parts), names
+
+
+def _conjuncts(node: ast.AST):
+    """Yield the top-level AND'd terms of an expression"""
+    if isinstance(node, ast.BoolOp) and isinstance(node.op, ast.And):
+        for value in node.values:
+            yield from _conjuncts(value)
+    else:
+        yield node
+
+
+def _literal(node: ast.AST):
+    """Literal value of a node, raises ValueError if not a literal"""
+    value = ast.literal_eval(node)
+    return list(value) if isinstance(value, (list, tuple, set)) else value
+
+
+def parse_predicates(query: str) -> list:
+    """Parse Predicates
+
+    Extracts the simple predicates (column <op> literal) AND'd at the top level of
+    a df.query string. Anything else (or, not, @variables, arithmetic) is skipped --
+    the predicates are only used to narrow what is read, the full query string
+    must still be applied afterwards.
+
+    Parameters
+    ----------
+        query : str
+            query string, i.e. "events == 'home_run' and game_date >= '2023-04-01'"
+
+    Returns
+    -------
+        list
+            list of (column, op, value) tuples, op one of _COMPARE_OPS
+            i.e. [("events", "==", "home_run"), ("game_date", ">=", "2023-04-01")]
+    """
+    expr, names = _to_python(query)
+    try:
+        tree = ast.parse(expr.strip(), mode="eval")
+    except SyntaxError:
+        logging.info(f"Could not parse query for predicates: {query}")
+        return []
+
+    predicates = []
+    for node in _conjuncts(tree.body):
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr == "isin"
+            and isinstance(node.func.value, ast.Name)
+            and len(node.args) == 1
+        ):
+            node = ast.Compare(
+                left=node.func.value, ops=[ast.In()], comparators=node.args
+            )
+        if not isinstance(node, ast.Compare):
+            continue
+
+        operands = [node.left] + node.comparators
+        for left, op, right in zip(operands[:-1], node.ops, operands[1:]):
+            op = _COMPARE_OPS.get(type(op))
+            if op is None:
+                continue
+            try:
+                if isinstance(left, ast.Name) and not isinstance(right, ast.Name):
+                    col, value = left.id, _literal(right)
+                elif isinstance(right, ast.Name) and op in _FLIPPED_OPS:
+                    col, value, op = right.id, _literal(left), _FLIPPED_OPS.get(op)
+                else:
+                    continue
+            except (ValueError, TypeError, SyntaxError):
+                continue
+            if col.startswith("__at_"):
+                continue
+            if isinstance(value, list):
+                op = {"==": "in", "!=": "not in"}.get(op, op)
+                if op not in ["in", "not in"]:
+                    continue
+            elif op in ["in", "not in"]:
+                continue
+            predicates.append((names.get(col, col), op, value))
+    return predicates
+
+
+def match_partition(game_date: str, predicates: list) -> bool:
+    """Match Partition
+
+    Whether a date partition can contain rows matching the predicates
+    (only game_date & game_year predicates are checked)
+
+    Parameters
+    ----------
+        game_date : str
+            partition date (i.e. "2023-09-01")
+        predicates : list
+            see parse_predicates
+
+    Returns
+    -------
+        bool
+            False if the partition can be skipped
+    """
+    dt = pd.Timestamp(game_date)
+    for col, op, value in predicates:
+        if col not in _PARTITION_COLS:
+            continue
+        try:
+            if col == "game_date":
+                part_value = dt
+                value = (
+                    [pd.Timestamp(v) for v in value]
+                    if isinstance(value, list)
+                    else pd.Timestamp(value)
+                )
+            else:
+                part_value = dt.year
+                value = (
+                    [int(v) for v in value] if isinstance(value, list) else int(value)
+                )
+            if not _OP_FUNCS.get(op)(part_value, value):
+                return False
+        except (ValueError, TypeError):
+            continue
+    return True
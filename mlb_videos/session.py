@@ -0,0 +1,369 @@
+import time
+import random
+import asyncio
+import threading
+import requests
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+import logging
+import logging.config
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_POOL_SIZE = 10
+_DEFAULT_TIMEOUT = (5, 60)
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF_FACTOR = 0.5
+_RETRY_STATUSES = [429, 500, 502, 503, 504]
+_RETRY_BACKOFF_MAX = 30
+
+_HOST_CONFIG = {
+    "baseballsavant.mlb.com": {"PoolSize": 16, "Timeout": (5, 120)},
+    "statsapi.mlb.com": {"PoolSize": 16, "Timeout": (5, 30)},
+    "fastball-gateway.mlb.com": {"PoolSize": 8, "Timeout": (5, 30)},
+}
+
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _retry_policy() -> Retry:
+    """Retry policy for the session's adapters
+
+    Only failed connections (request never sent) are retried here -- read errors
+    & 429/5xx responses are retried by get_with_retry, which takes a rate limiter
+    token per attempt
+
+    Returns
+    -------
+        Retry
+            retries connection errors w/ exponential backoff
+    """
+    return Retry(
+        total=_RETRY_TOTAL,
+        connect=_RETRY_TOTAL,
+        read=0,
+        status=0,
+        backoff_factor=_RETRY_BACKOFF_FACTOR,
+        allowed_methods=["GET", "HEAD"],
+        respect_retry_after_header=False,
+        raise_on_status=False,
+    )
+
+
+def backoff_delay(
+    attempt: int,
+    base: float = _RETRY_BACKOFF_FACTOR,
+    cap: float = _RETRY_BACKOFF_MAX,
+) -> float:
+    """Exponential backoff w/ full jitter
+
+    Parameters
+    ----------
+        attempt : int
+            retry attempt (0 for the first retry)
+        base (float, optional): float, default _RETRY_BACKOFF_FACTOR
+            seconds to wait before the first retry (upper bound)
+        cap (float, optional): float, default _RETRY_BACKOFF_MAX
+            max seconds to wait
+
+    Returns
+    -------
+        float
+            seconds to wait, random between 0 and min(cap, base * 2^attempt)
+    """
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+def retry_delay(attempt: int, retry_after: str = None) -> float:
+    """Seconds to wait before retrying
+
+    Parameters
+    ----------
+        attempt : int
+            retry attempt (0 for the first retry)
+        retry_after (str, optional): str, default None
+            Retry-After header of the response (seconds), if any
+
+    Returns
+    -------
+        float
+            Retry-After (capped at _RETRY_BACKOFF_MAX) if passed, else jittered backoff
+    """
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), _RETRY_BACKOFF_MAX)
+    return backoff_delay(attempt)
+
+
+class RateLimiter:
+    """Token bucket rate limiter (thread-safe)"""
+
+    def __init__(self, rate: float, burst: int = None):
+        """Initialize Rate Limiter
+
+        Parameters
+        ----------
+            rate : float
+                tokens (requests) added per second
+            burst (int, optional): int, default None
+                max tokens held at once, defaults to ceil(rate)
+        """
+        self.rate = float(rate)
+        self.burst = burst if burst else max(1, int(-(-self.rate // 1)))
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take a token, blocking until one is available
+
+        Returns
+        -------
+            float
+                seconds spent waiting
+        """
+        waited = 0.0
+        wait = self._take()
+        while wait:
+            time.sleep(wait)
+            waited += wait
+            wait = self._take()
+        return waited
+
+    async def acquire_async(self) -> float:
+        """Take a token, awaiting until one is available (doesn't block the event loop)
+
+        Returns
+        -------
+            float
+                seconds spent waiting
+        """
+        waited = 0.0
+        wait = self._take()
+        while wait:
+            await asyncio.sleep(wait)
+            waited += wait
+            wait = self._take()
+        return waited
+
+    def _take(self) -> float:
+        """Take a token if available
+
+        Returns
+        -------
+            float
+                0 if a token was taken, else seconds until the next token
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0
+            return (1 - self.tokens) / self.rate
+
+
+def get_with_retry(
+    session: requests.Session,
+    url: str,
+    limiter: RateLimiter = None,
+    retries: int = _RETRY_TOTAL,
+    **kwargs,
+) -> requests.Response:
+    """GET w/ rate limiting & jittered exponential backoff
+
+    Retries connection errors, timeouts & 429/5xx responses -- honoring Retry-After.
+    Each attempt (including retries) takes a token from the limiter, if passed.
+
+    Parameters
+    ----------
+        session : requests.Session
+            session to perform the request with
+        url : str
+            request url
+        limiter (RateLimiter, optional): RateLimiter, default None
+            rate limiter shared by concurrent callers
+        retries (int, optional): int, default _RETRY_TOTAL
+            max retries after the first attempt
+        **kwargs
+            passed to session.get (timeout, stream, params, etc.)
+
+    Raises
+    ------
+        requests.RequestException
+            If the final attempt fails or returns an error status
+
+    Returns
+    -------
+        requests.Response
+    """
+    for attempt in range(retries + 1):
+        if limiter:
+            limiter.acquire()
+        try:
+            resp = session.get(url, **kwargs)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if attempt == retries:
+                raise
+            delay = backoff_delay(attempt)
+            logging.warning(f"Request failed ({e}), retrying in {delay:.1f}s: {url}")
+            time.sleep(delay)
+            continue
+
+        if resp.status_code not in _RETRY_STATUSES or attempt == retries:
+            resp.raise_for_status()
+            return resp
+
+        delay = retry_delay(attempt, resp.headers.get("Retry-After"))
+        resp.close()
+        logging.warning(
+            f"Request returned {resp.status_code}, retrying in {delay:.1f}s: {url}"
+        )
+        time.sleep(delay)
+
+
+async def get_with_retry_async(
+    http: "aiohttp.ClientSession",
+    url: str,
+    limiter: RateLimiter = None,
+    retries: int = _RETRY_TOTAL,
+    semaphore: asyncio.Semaphore = None,
+    params: dict = None,
+) -> bytes:
+    """GET w/ rate limiting & jittered exponential backoff (asyncio)
+
+    See get_with_retry -- requires aiohttp
+
+    Parameters
+    ----------
+        http : aiohttp.ClientSession
+            session to perform the request with
+        url : str
+            request url
+        limiter (RateLimiter, optional): RateLimiter, default None
+            rate limiter shared by concurrent callers
+        retries (int, optional): int, default _RETRY_TOTAL
+            max retries after the first attempt
+        semaphore (asyncio.Semaphore, optional): asyncio.Semaphore, default None
+            limits requests in flight
+        params (dict, optional): dict, default None
+            query params
+
+    Raises
+    ------
+        aiohttp.ClientError
+            If the final attempt fails or returns an error status
+
+    Returns
+    -------
+        bytes
+            response body
+    """
+    semaphore = semaphore if semaphore else asyncio.Semaphore(1)
+    for attempt in range(retries + 1):
+        if limiter:
+            await limiter.acquire_async()
+        try:
+            async with semaphore:
+                async with http.get(url, params=params) as resp:
+                    if resp.status not in _RETRY_STATUSES or attempt == retries:
+                        resp.raise_for_status()
+                        logging.info(f"Performed request for: {resp.url}")
+                        return await resp.read()
+                    delay = retry_delay(attempt, resp.headers.get("Retry-After"))
+                    logging.warning(
+                        f"Request returned {resp.status}, retrying in {delay:.1f}s: {url}"
+                    )
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            if attempt == retries:
+                raise
+            delay = retry_delay(attempt)
+            logging.warning(f"Request failed ({e}), retrying in {delay:.1f}s: {url}")
+        await asyncio.sleep(delay)
+
+
+class HTTPSession(requests.Session):
+    """Pooled, keep-alive HTTP session shared across API clients"""
+
+    def __init__(self, host_config: dict = _HOST_CONFIG):
+        """Initialize HTTP Session
+
+        Mounts an adapter (connection pool + retry policy) per known host,
+        all other hosts use the default pool size
+
+        Parameters
+        ----------
+            host_config (dict, optional): dict, default _HOST_CONFIG
+                pool size & timeout per host
+        """
+        super().__init__()
+        self.host_config = host_config
+        self.mount("https://", self._adapter(_DEFAULT_POOL_SIZE))
+        self.mount("http://", self._adapter(_DEFAULT_POOL_SIZE))
+        for host, cfg in self.host_config.items():
+            self.mount(f"https://{host}", self._adapter(cfg.get("PoolSize")))
+
+    @staticmethod
+    def _adapter(pool_size: int) -> HTTPAdapter:
+        """Build HTTP Adapter
+
+        Parameters
+        ----------
+            pool_size : int
+                max connections kept alive in the pool
+
+        Returns
+        -------
+            HTTPAdapter
+        """
+        return HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=_retry_policy(),
+        )
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Perform request, applying the host's default timeout if none passed
+
+        Parameters
+        ----------
+            method : str
+                HTTP method
+            url : str
+                request url
+
+        Returns
+        -------
+            requests.Response
+        """
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.host_config.get(urlparse(url).hostname, {}).get(
+                "Timeout", _DEFAULT_TIMEOUT
+            )
+        return super().request(method, url, **kwargs)
+
+
+def get_session() -> HTTPSession:
+    """Get the shared HTTP session (created on first use)
+
+    Returns
+    -------
+        HTTPSession
+    """
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                _SESSION = HTTPSession()
+                logging.info(f"Created shared HTTP session..")
+    return _SESSION
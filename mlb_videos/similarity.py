@@ -0,0 +1,225 @@
+import os
+import pickle
+import pathlib
+import numpy as np
+import pandas as pd
+from typing import Union
+
+from .statcast import _UNIQUE_IDENTIFIER_NAME, build_pitch_id, _STORE_PATH
+from .cache.statcast_store import StatcastStore
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
+
+import logging
+import logging.config
+
+logger = logging.getLogger(__name__)
+
+_SIMILARITY_INDEX_PATH = (
+    f"{os.path.dirname(os.path.abspath(__file__))}/cache/similarity/index.pkl"
+)
+_SIMILARITY_FEATURES = [
+    "release_speed",
+    "release_spin_rate",
+    "pfx_x",
+    "pfx_z",
+    "plate_x",
+    "plate_z",
+]
+_SIMILARITY_ID_COLS = ["game_pk", "at_bat_number", "pitch_number"]
+_CANDIDATE_RATIO = 8
+
+
+class PitchIndex:
+    """Nearest neighbor index of pitches over (standardized) Statcast kinematics
+
+    KD-tree (scipy cKDTree, see requirements.txt). If scipy can't be imported,
+    falls back to a vectorized numpy distance + partial sort over all pitches --
+    same neighbors (up to ties), slower queries on large indexes
+    """
+
+    def __init__(self, df: pd.DataFrame, features: list = _SIMILARITY_FEATURES):
+        """Initialize Pitch Index
+
+        Pitches missing any feature are left out. Each feature is standardized
+        (mean 0, std 1) so none dominates the distance.
+
+        Parameters
+        ----------
+            df : pd.DataFrame
+                statcast pitches (pitch_id or game_pk/at_bat_number/pitch_number)
+            features (list, optional): list, default _SIMILARITY_FEATURES
+                columns to index
+        """
+        self.features = list(features)
+        values = df[self.features].apply(pd.to_numeric, errors="coerce")
+        values = values.to_numpy(dtype="float64", na_value=np.nan)
+        valid = ~np.isnan(values).any(axis=1)
+        if _UNIQUE_IDENTIFIER_NAME in df.columns:
+            ids = df[_UNIQUE_IDENTIFIER_NAME]
+        else:
+            ids = build_pitch_id(df)
+        self.ids = ids.astype(str).to_numpy()[valid]
+        values = values[valid]
+        self.mean = values.mean(axis=0) if len(values) else np.zeros(len(features))
+        self.std = values.std(axis=0) if len(values) else np.ones(len(features))
+        self.std[self.std == 0] = 1.0
+        self.points = (values - self.mean) / self.std
+        self.id_index = pd.Index(self.ids)
+        self.tree = cKDTree(self.points) if cKDTree is not None else None
+        logging.info(
+            f"Built pitch index: {len(self.ids)} pitches, {len(self.features)} features"
+            f" ({'kd-tree' if self.tree is not None else 'brute force'})"
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def from_store(
+        cls,
+        filters: dict,
+        queries: Union[list, str] = None,
+        features: list = _SIMILARITY_FEATURES,
+        store_path: str = _STORE_PATH,
+    ) -> "PitchIndex":
+        """Build from the Statcast store, reading only the id & feature columns
+
+        Parameters
+        ----------
+            filters : dict
+                statcast filters the data was saved with (see statcast_filters)
+            queries (Union[list, str], optional): Union[list, str], default None
+                query string(s) selecting the pitches to index
+                    ex. "game_year == 2023"
+            features (list, optional): list, default _SIMILARITY_FEATURES
+                columns to index
+            store_path (str, optional): str, default _STORE_PATH
+                root folder of the statcast store
+
+        Returns
+        -------
+            PitchIndex
+        """
+        df = StatcastStore(store_path).query(
+            filters, queries, columns=_SIMILARITY_ID_COLS + list(features)
+        )
+        return cls(df, features)
+
+    def save(self, path: str = _SIMILARITY_INDEX_PATH) -> None:
+        """Persist the index (pickle)
+
+        Parameters
+        ----------
+            path (str, optional): str, default _SIMILARITY_INDEX_PATH
+                file path
+        """
+        path = pathlib.Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        logging.info(f"Saved pitch index: {path}")
+
+    @staticmethod
+    def load(path: str = _SIMILARITY_INDEX_PATH) -> "PitchIndex":
+        """Load a persisted index
+
+        Parameters
+        ----------
+            path (str, optional): str, default _SIMILARITY_INDEX_PATH
+                file path
+
+        Returns
+        -------
+            PitchIndex
+        """
+        with open(path, "rb") as f:
+            index = pickle.load(f)
+        if index.tree is None and cKDTree is not None:
+            index.tree = cKDTree(index.points)
+        return index
+
+    def vector(self, pitch_id: str) -> Union[np.ndarray, None]:
+        """Feature values of an indexed pitch (None if not indexed)"""
+        pos = self.id_index.get_indexer([str(pitch_id)])[0]
+        if pos < 0:
+            return None
+        return self.points[pos] * self.std + self.mean
+
+    def _nearest(self, point: np.ndarray, k: int) -> tuple:
+        """k nearest (distances, positions), closest first"""
+        k = min(k, len(self.ids))
+        if k <= 0:
+            return np.array([]), np.array([], dtype=int)
+        if self.tree is not None:
+            dist, pos = self.tree.query(point, k=k)
+            return np.atleast_1d(dist), np.atleast_1d(pos)
+        dist = np.sqrt(((self.points - point) ** 2).sum(axis=1))
+        pos = (
+            np.argpartition(dist, k - 1)[:k] if k < len(dist) else np.arange(len(dist))
+        )
+        pos = pos[np.argsort(dist[pos], kind="stable")]
+        return dist[pos], pos
+
+    def query(
+        self,
+        values: Union[list, np.ndarray],
+        k: int = 20,
+        candidates: Union[list, pd.Index] = None,
+        exclude: set = None,
+    ) -> pd.DataFrame:
+        """Query
+
+        Most similar pitches to a feature vector
+
+        Parameters
+        ----------
+            values : Union[list, np.ndarray]
+                raw feature values, in self.features order
+            k (int, optional): int, default 20
+                matches to return
+            candidates (Union[list, pd.Index], optional): Union[list, pd.Index], default None
+                only return these pitch ids (i.e. those still in a dataframe)
+                the search widens until k are found
+            exclude (set, optional): set, default None
+                pitch ids to leave out (i.e. the reference pitch)
+
+        Returns
+        -------
+            pd.DataFrame
+                pitch_id, similarity_distance -- closest first
+        """
+        point = (np.asarray(values, dtype="float64") - self.mean) / self.std
+        exclude = [str(e) for e in exclude or []]
+        if candidates is not None:
+            candidates = pd.Index(candidates).astype(str).unique()
+
+        if candidates is not None and len(candidates) * _CANDIDATE_RATIO < len(self):
+            # Few candidates -- compare against them directly
+            pos = self.id_index.get_indexer(candidates)
+            pos = pos[pos >= 0]
+            pos = pos[~np.isin(self.ids[pos], exclude)]
+            dist = np.sqrt(((self.points[pos] - point) ** 2).sum(axis=1))
+            keep = np.lexsort((self.ids[pos], dist))[:k]
+        else:
+            n = k + len(exclude)
+            while True:
+                dist, pos = self._nearest(point, n)
+                keep = ~np.isin(self.ids[pos], exclude)
+                if candidates is not None:
+                    keep &= candidates.get_indexer(self.ids[pos]) >= 0
+                keep = np.flatnonzero(keep)[:k]
+                if len(keep) == k or n >= len(self):
+                    break
+                n *= 4
+        return pd.DataFrame(
+            {
+                _UNIQUE_IDENTIFIER_NAME: self.ids[pos[keep]],
+                "similarity_distance": dist[keep],
+            }
+        )
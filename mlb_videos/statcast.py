@@ -2,12 +2,29 @@ import os
 import io
 import re
 import requests
+import numpy as np
 import pandas as pd
 from tqdm import tqdm
 import concurrent.futures
 from typing import Union
+from datetime import datetime, timedelta
 
-from .utils import yesterday, get_date_range
+from .utils import (
+    yesterday,
+    get_date_range,
+    split_date_range,
+    merge_date_ranges,
+)
+from .constants import _DT_FORMAT, _STATCAST_SCHEMA, _STATCAST_DATE_COLS
+from .session import get_session, get_with_retry, RateLimiter
+from .planner import (
+    _SAVANT_ROW_CAP,
+    estimate_rows_per_day,
+    chunk_days,
+    plan_chunks,
+)
+from .cache.statcast_cache import StatcastCache, is_final_date, _CACHE_REFRESH_DAYS
+from .cache.statcast_store import StatcastStore
 
 import logging
 import logging.config
@@ -25,9 +42,20 @@ _DEFAULT_SORT = ["game_date", "game_pk", "at_bat_number", "pitch_number"]
 _UNIQUE_IDENTIFIER_COLS = ["game_pk", "at_bat_number", "pitch_number"]
 _UNIQUE_IDENTIFIER_NAME = "pitch_id"
 _UNIQUE_IDENTIFIER_DELIMITER = "|"
+_PACKED_KEY_NAME = "pitch_key"
+_PACKED_KEY_BITS = {"game_pk": 32, "at_bat_number": 12, "pitch_number": 8}
 
-_REQUEST_TIMEOUT = None
+_REQUEST_TIMEOUT = (5, 120)
+_REQUEST_RETRIES = 4
+_MAX_WORKERS = 8
+_RATE_LIMIT = 4.0
+_STREAM_BATCH_ROWS = 5000
+_CATEGORY_MAX_RATIO = 0.5
+_FLOAT32_MAX_DECIMALS = 6
 _CACHE_PATH = f"{os.path.dirname(os.path.abspath(__file__))}/cache/statcast"
+_STORE_PATH = f"{os.path.dirname(os.path.abspath(__file__))}/cache/store"
+_REVERIFY_DAYS = 3
+_REQUIRED_COLS = list(dict.fromkeys(_DEFAULT_SORT + _UNIQUE_IDENTIFIER_COLS))
 
 _STATCAST_DATE_FORMATS = [
     (re.compile(r"^\d{4}-\d{1,2}-\d{1,2}$"), "%Y-%m-%d"),
@@ -38,9 +66,124 @@ _STATCAST_DATE_FORMATS = [
 ]
 
 
+def iter_statcast_csv(buf, batch_rows: int = _STREAM_BATCH_ROWS):
+    """Iterate Statcast CSV
+
+    Parses the Savant CSV straight from a (byte) stream with the declared schema,
+    yielding parsed batches of up to batch_rows rows
+
+    Parameters
+    ----------
+        buf
+            file-like object with the CSV content (i.e. response.raw)
+        batch_rows (int, optional): int, default _STREAM_BATCH_ROWS
+            max rows per batch
+
+    Yields
+    ------
+        pd.DataFrame
+            parsed batch
+    """
+    with pd.read_csv(buf, dtype=_STATCAST_SCHEMA, chunksize=batch_rows) as reader:
+        for batch in reader:
+            for col, date_format in _STATCAST_DATE_COLS.items():
+                if col in batch.columns:
+                    batch[col] = pd.to_datetime(
+                        batch[col], format=date_format, errors="coerce"
+                    )
+            yield parse_df(batch)
+
+
+def parse_statcast_content(content: bytes) -> pd.DataFrame:
+    """Parse Statcast Content
+
+    Parses a complete Savant CSV response body (see read_statcast_csv, parse_df)
+
+    Parameters
+    ----------
+        content : bytes
+            response body
+
+    Raises
+    ------
+        Exception
+            If Savant returned an error message instead of results
+
+    Returns
+    -------
+        pd.DataFrame
+            parsed dataframe, empty if the response had no content
+    """
+    try:
+        df = parse_df(read_statcast_csv(io.BytesIO(content)))
+    except pd.errors.EmptyDataError:
+        return pd.DataFrame()
+    if "error" in df.columns:
+        raise Exception(df["error"].values[0])
+    return df
+
+
+def restore_categoricals(df: pd.DataFrame) -> pd.DataFrame:
+    """Restore categorical columns
+
+    Concatenating categoricals with different categories (i.e. per day/batch)
+    falls back to object -- re-apply the declared categorical dtype
+
+    Parameters
+    ----------
+        df : pd.DataFrame
+
+    Returns
+    -------
+        pd.DataFrame
+    """
+    for col, dtype in _STATCAST_SCHEMA.items():
+        col = col.replace(".", "_")
+        if (
+            dtype == "category"
+            and col in df.columns
+            and not isinstance(df[col].dtype, pd.CategoricalDtype)
+        ):
+            df[col] = df[col].astype("category")
+    return df
+
+
+def read_statcast_csv(buf) -> pd.DataFrame:
+    """Read Statcast CSV
+
+    Reads the Savant CSV with the declared schema (_STATCAST_SCHEMA), so types are
+    set in one vectorized pass instead of being inferred per column afterwards.
+    If the response does not match the schema, falls back to type inference.
+
+    Parameters
+    ----------
+        buf
+            file-like object with the CSV content
+
+    Returns
+    -------
+        pd.DataFrame
+            Dataframe with declared dtypes applied
+    """
+    try:
+        df = pd.read_csv(buf, dtype=_STATCAST_SCHEMA)
+    except (ValueError, TypeError) as e:
+        logging.warning(f"Statcast CSV did not match schema, inferring types: {e}")
+        buf.seek(0)
+        df = pd.read_csv(buf)
+
+    for col, date_format in _STATCAST_DATE_COLS.items():
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col], format=date_format, errors="coerce")
+    return df
+
+
 def parse_df(df: pd.DataFrame) -> pd.DataFrame:
     """Parse Statcast Dataframe
 
+    Columns declared in _STATCAST_SCHEMA are already typed by read_statcast_csv,
+    the remaining string columns are sniffed for percentages & dates
+
     Parameters
     ----------
         df : pd.DataFrame
@@ -51,7 +194,11 @@ def parse_df(df: pd.DataFrame) -> pd.DataFrame:
         pd.DataFrame
             Cleaned, parsed, normalized dataframe
     """
-    str_cols = [dt[0] for dt in df.dtypes.items() if str(dt[1]) in ["object", "string"]]
+    str_cols = [
+        dt[0]
+        for dt in df.dtypes.items()
+        if str(dt[1]) in ["object", "string", "str"] and dt[0] not in _STATCAST_SCHEMA
+    ]
 
     for strcol in str_cols:
         fvi = df[strcol].first_valid_index()
@@ -66,10 +213,10 @@ def parse_df(df: pd.DataFrame) -> pd.DataFrame:
         else:
             for date_regex, date_format in _STATCAST_DATE_FORMATS:
                 if isinstance(fv, str) and date_regex.match(fv):
-                    df[strcol] = df[strcol].apply(
-                        pd.to_datetime, errors="ignore", format=date_format
-                    )
-                    df[strcol] = df[strcol].convert_dtypes(convert_string=False)
+                    try:
+                        df[strcol] = pd.to_datetime(df[strcol], format=date_format)
+                    except (ValueError, TypeError):
+                        pass
                     break
 
     df.rename(
@@ -79,6 +226,255 @@ def parse_df(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def _as_str(s: pd.Series) -> np.ndarray:
+    """Convert series to str, formatting each distinct value only once
+
+    Parameters
+    ----------
+        s : pd.Series
+
+    Returns
+    -------
+        np.ndarray
+            object array of str, matching str(value) per element
+    """
+    codes, uniques = pd.factorize(s)
+    labels = [str(u) for u in uniques]
+    labels.append(str(s[codes == -1].iloc[0]) if (codes == -1).any() else "")
+    return np.array(labels, dtype=object)[codes]
+
+
+def _sort_key_values(s: pd.Series) -> np.ndarray:
+    """Sort key column as a numpy array (nullable numerics -> float w/ NaN)"""
+    if isinstance(s.dtype, pd.api.extensions.ExtensionDtype) and (
+        pd.api.types.is_numeric_dtype(s)
+    ):
+        return s.to_numpy(dtype="float64", na_value=np.nan)
+    return s.to_numpy()
+
+
+def is_sorted(df: pd.DataFrame, by: list = _DEFAULT_SORT) -> bool:
+    """Is Sorted
+
+    Checks (in one vectorized pass) that a dataframe is sorted ascending by
+    multiple columns, comparing each row to the next one key at a time
+
+    Parameters
+    ----------
+        df : pd.DataFrame
+            dataframe to check
+        by (list, optional): list, default _DEFAULT_SORT
+            sort columns
+
+    Returns
+    -------
+        bool
+            True if sorted (or fewer than 2 rows)
+    """
+    if len(df) < 2:
+        return True
+    descending = np.zeros(len(df) - 1, dtype=bool)
+    tied = np.ones(len(df) - 1, dtype=bool)
+    for col in by:
+        values = _sort_key_values(df[col])
+        prev, curr = values[:-1], values[1:]
+        descending |= tied & (prev > curr)
+        tied &= prev == curr
+    return not descending.any()
+
+
+def statcast_filters(params: dict) -> dict:
+    """Statcast Filters
+
+    Filter set of statcast params, as used to key the local store & cache
+    (games, dates & non-filter params are ignored)
+
+    Parameters
+    ----------
+        params : dict
+            statcast params, i.e. {"pitch_types": "SL", "start_date": "2023-09-01"}
+
+    Returns
+    -------
+        dict
+            i.e. {"pitch_types": ["SL"]}
+    """
+    return {
+        arg: sorted(str(x) for x in (v if isinstance(v, list) else [v]))
+        for arg, v in params.items()
+        if arg in Statcast.CleanupArgs and arg != "games" and v
+    }
+
+
+def build_pitch_id(df: pd.DataFrame) -> pd.Series:
+    """Build Pitch ID
+
+    Unique identifier per pitch, `game_pk|at_bat_number|pitch_number`
+
+    Parameters
+    ----------
+        df : pd.DataFrame
+            statcast dataframe
+
+    Returns
+    -------
+        pd.Series
+            pitch_id (str)
+    """
+    parts = [_as_str(df[col]) for col in _UNIQUE_IDENTIFIER_COLS]
+    return pd.Series(
+        [_UNIQUE_IDENTIFIER_DELIMITER.join(p) for p in zip(*parts)],
+        index=df.index,
+        dtype=object,
+    )
+
+
+def build_pitch_key(df: pd.DataFrame) -> pd.Series:
+    """Build Packed Pitch Key
+
+    Packs `game_pk`, `at_bat_number`, `pitch_number` into a single 64-bit int
+    (see _PACKED_KEY_BITS) -- cheaper than pitch_id for joins & dedup
+
+    Parameters
+    ----------
+        df : pd.DataFrame
+            statcast dataframe
+
+    Raises
+    ------
+        ValueError
+            If a value does not fit in its allotted bits
+
+    Returns
+    -------
+        pd.Series
+            pitch_key (Int64)
+    """
+    key = pd.Series(0, index=df.index, dtype="Int64")
+    for col, bits in _PACKED_KEY_BITS.items():
+        vals = df[col].astype("Int64")
+        valid = vals.dropna()
+        if len(valid) and (valid.max() >= (1 << bits) or valid.min() < 0):
+            raise ValueError(f"{col} out of range for packed key ({bits} bits)")
+        key = key * (1 << bits) + vals
+    return key
+
+
+def unpack_pitch_key(key: int) -> tuple:
+    """Unpack Pitch Key
+
+    Parameters
+    ----------
+        key : int
+            packed pitch key (see build_pitch_key)
+
+    Returns
+    -------
+        tuple
+            (game_pk, at_bat_number, pitch_number)
+    """
+    vals = []
+    for bits in reversed(list(_PACKED_KEY_BITS.values())):
+        vals.append(key & ((1 << bits) - 1))
+        key >>= bits
+    return tuple(reversed(vals))
+
+
+def _float32_lossless(s: pd.Series) -> bool:
+    """Whether a float column survives a float32 round-trip
+
+    Savant values are decimals (i.e. 93.4) -- the column is lossless in float32
+    if every value, rounded back to the column's decimal precision, is unchanged
+
+    Parameters
+    ----------
+        s : pd.Series
+            float column
+
+    Returns
+    -------
+        bool
+    """
+    vals = s.dropna().to_numpy(dtype="float64")
+    if vals.size == 0:
+        return True
+    if not np.isfinite(vals).all() or np.abs(vals).max() > np.finfo("float32").max:
+        return False
+    f32 = vals.astype("float32").astype("float64")
+    for decimals in range(0, _FLOAT32_MAX_DECIMALS + 1):
+        if np.array_equal(np.round(vals, decimals), vals):
+            return np.array_equal(np.round(f32, decimals), vals)
+    return False
+
+
+def _downcast_int(s: pd.Series) -> pd.Series:
+    """Downcast int column to the smallest int type holding its range
+
+    Parameters
+    ----------
+        s : pd.Series
+            int column (numpy or nullable)
+
+    Returns
+    -------
+        pd.Series
+    """
+    valid = s.dropna()
+    nullable = isinstance(s.dtype, pd.api.extensions.ExtensionDtype)
+    for dtype in ["int8", "int16", "int32"]:
+        info = np.iinfo(dtype)
+        if valid.empty or (valid.min() >= info.min and valid.max() <= info.max):
+            return s.astype(dtype.capitalize() if nullable else dtype)
+    return s
+
+
+def compact_df(df: pd.DataFrame, columns: list = None) -> pd.DataFrame:
+    """Compact Dataframe
+
+    Reduces the memory footprint of a statcast dataframe:
+        Drops columns not in `columns` (if passed)
+        Converts repeated strings to categoricals
+        Downcasts ints to the smallest type holding their range,
+            floats to float32 where lossless (see _float32_lossless)
+
+    Parameters
+    ----------
+        df : pd.DataFrame
+            statcast dataframe
+        columns (list, optional): list, default None
+            columns to keep, all if None
+
+    Returns
+    -------
+        pd.DataFrame
+            compacted dataframe
+    """
+    before = df.memory_usage(deep=True).sum()
+    if columns:
+        df = df[[c for c in df.columns if c in set(columns)]].copy()
+
+    for col in df.columns:
+        s = df[col]
+        if isinstance(s.dtype, pd.CategoricalDtype) or pd.api.types.is_bool_dtype(s):
+            continue
+        elif pd.api.types.is_integer_dtype(s):
+            df[col] = _downcast_int(s)
+        elif pd.api.types.is_float_dtype(s):
+            if _float32_lossless(s):
+                nullable = isinstance(s.dtype, pd.api.extensions.ExtensionDtype)
+                df[col] = s.astype("Float32" if nullable else "float32")
+        elif pd.api.types.is_object_dtype(s) or pd.api.types.is_string_dtype(s):
+            if s.nunique(dropna=True) <= _CATEGORY_MAX_RATIO * len(s):
+                df[col] = s.astype("category")
+
+    after = df.memory_usage(deep=True).sum()
+    logging.info(
+        f"Compacted statcast df: {before / 1024**2:,.1f} MB -> {after / 1024**2:,.1f} MB"
+    )
+    df.attrs["memory_usage"] = {"before": int(before), "after": int(after)}
+    return df
+
+
 class Statcast:
     CleanupArgs = [
         "games",
@@ -88,6 +484,8 @@ class Statcast:
         "pitch_types",
         "events",
         "descriptions",
+        "innings",
+        "counts",
     ]
 
     """Statcast API Client"""
@@ -105,7 +503,22 @@ class Statcast:
         pitch_types: Union[list, str] = None,
         events: Union[list, str] = None,
         descriptions: Union[list, str] = None,
+        innings: Union[list, int] = None,
+        counts: Union[list, str] = None,
         save_local: bool = False,
+        use_cache: bool = True,
+        columns: list = None,
+        store_path: str = _STORE_PATH,
+        incremental: bool = False,
+        reverify_days: int = _REVERIFY_DAYS,
+        session: requests.Session = None,
+        chunking: bool = True,
+        packed_key: bool = False,
+        lazy: bool = False,
+        compact: bool = False,
+        max_workers: int = _MAX_WORKERS,
+        rate_limit: float = _RATE_LIMIT,
+        ordered: bool = True,
     ):
         """Initialize Statcast API Client
 
@@ -134,6 +547,50 @@ class Statcast:
             descriptions (list, optional): list, default None
                 Description of pitch
                 i.e. called strike, ball, hit_into_play
+            innings (list, optional): list, default None
+                List of innings to filter (1-9)
+            counts (list, optional): list, default None
+                List of counts (balls & strikes) to filter
+                i.e. 32 (full count), 00
+            save_local (bool, optional): bool, default False
+                Persist each fetched date to the columnar (parquet) store,
+                reading finalized dates back from the store on later runs
+                (dates only -- a game is not a full date partition)
+            use_cache (bool, optional): bool, default True
+                Serve finalized dates/games from the local cache (_CACHE_PATH)
+            columns (list, optional): list, default None
+                Only keep these columns (plus the sort/identifier columns)
+                When reading from the store, only these columns are read from disk
+            store_path (str, optional): str, default _STORE_PATH
+                Root folder of the columnar store
+            incremental (bool, optional): bool, default False
+                Only fetch dates after the last fully-ingested date (watermark) for this
+                filter set, reading earlier dates from the store. Implies save_local.
+            reverify_days (int, optional): int, default _REVERIFY_DAYS
+                Trailing days before the watermark to fetch again (bypassing the cache),
+                as Savant revises recent games
+            session (requests.Session, optional): requests.Session, default None
+                HTTP session to use, defaults to the shared pooled session
+            chunking (bool, optional): bool, default True
+                Request multiple consecutive dates per request, sized by filter selectivity
+            packed_key (bool, optional): bool, default False
+                Also add `pitch_key`, pitch_id packed into a 64-bit int for joins/dedup
+            lazy (bool, optional): bool, default False
+                Only validate args, don't request anything --
+                use iter_batches() to stream the results
+            compact (bool, optional): bool, default False
+                Convert repeated strings to categoricals & downcast numeric columns
+                where lossless, see compact_df (memory before/after is logged)
+            max_workers (int, optional): int, default _MAX_WORKERS
+                Max concurrent requests
+            rate_limit (float, optional): float, default _RATE_LIMIT
+                Max requests per second to Savant (incl. retries), None for no limit
+                Throttled (429) & failed (5xx) requests are retried w/ jittered backoff,
+                iterations that still fail are logged & kept in self.errors
+            ordered (bool, optional): bool, default True
+                Return the df sorted by _DEFAULT_SORT -- results are collected in
+                iteration order, so pre-sorted partitions only need concatenating
+                False skips ordering altogether (i.e. when ranking/sorting downstream)
         """
         self.start_date = start_date
         self.end_date = end_date if end_date else yesterday()
@@ -146,16 +603,48 @@ class Statcast:
         self.pitch_types = pitch_types
         self.events = events
         self.descriptions = descriptions
+        self.innings = innings
+        self.counts = counts
         self.iteration_type = None
 
         self.save_local = save_local
+        self.session = session if session else get_session()
+        self.cache = StatcastCache(_CACHE_PATH) if use_cache else None
+        self.incremental = incremental
+        self.reverify_days = reverify_days
+        self.store = StatcastStore(store_path) if save_local or incremental else None
+        self.synced_iterations = []
+        self.reverify_iterations = []
+        self.chunking = chunking
+        self.packed_key = packed_key
+        self.compact = compact
+        self.max_workers = max_workers
+        self.limiter = (
+            RateLimiter(rate_limit, burst=max_workers) if rate_limit else None
+        )
+        self.errors = {}
+        self.ordered = ordered
+        self.columns = (
+            list(dict.fromkeys(_REQUIRED_COLS + list(columns))) if columns else None
+        )
         self.df_list = []
+        self.results = {}
         self.df = None
 
         self._validate_args()
         self._cleanup_args()
+        self._apply_watermark()
+        if lazy:
+            return
         self.concurrent_requests()
+        self._update_watermark()
         self.create_df()
+        if self.errors:
+            logging.warning(
+                f"{len(self.errors)} statcast iteration(s) failed: {sorted(self.errors)}"
+            )
+        if self.cache:
+            logging.info(f"Statcast cache stats: {self.cache.stats()}")
 
     def _validate_args(self):
         """Class Argument Validation
@@ -171,6 +660,11 @@ class Statcast:
             self.iteration_type = "games"
             self.iterations = self.games
             logging.info(f"Validated args, iterating by games.")
+            if self.store:
+                logging.warning(
+                    "The statcast store is partitioned by date -- "
+                    "games are cached, but not saved to the store."
+                )
         elif self.start_date is not None:
             self.iteration_type = "dates"
             self.iterations = get_date_range(self.start_date, self.end_date)
@@ -194,7 +688,68 @@ class Statcast:
             ):
                 setattr(self, arg, [getattr(self, arg)])
 
-    def _build_url(self, iter_val) -> str:
+    def _apply_watermark(self):
+        """Apply Watermark (incremental mode)
+
+        Splits the date iterations into dates already synced to the store
+        and dates that must be fetched (after the watermark, less reverify_days)
+        """
+        if not self.incremental or self.iteration_type != "dates":
+            return
+        watermark = self.store.get_watermark(self._filters())
+        self.synced_iterations, self.iterations = split_date_range(
+            self.iterations, watermark, self.reverify_days
+        )
+        # Dates re-checked for revisions are refetched, not served from the cache
+        if watermark:
+            self.reverify_iterations = [
+                d
+                for d in self.iterations
+                if watermark.get("start") <= d <= watermark.get("watermark")
+            ]
+        logging.info(
+            f"Incremental sync from watermark {watermark}: "
+            f"{len(self.synced_iterations)} synced, {len(self.iterations)} to fetch."
+        )
+
+    def _update_watermark(self):
+        """Update Watermark (incremental mode)
+
+        Every in-season date requested in this run is now in the store,
+        through the latest finalized date -- merge that range into the watermark
+        Only advances through the last date before the first failed date (self.errors)
+        """
+        if not self.incremental or self.iteration_type != "dates":
+            return
+        filters = self._filters()
+        cutoff = (datetime.now() - timedelta(days=_CACHE_REFRESH_DAYS)).strftime(
+            _DT_FORMAT
+        )
+        if self.errors:
+            cutoff = min(cutoff, min(self.errors))
+        final_dates = [
+            d for d in self.synced_iterations + self.iterations if d < cutoff
+        ]
+        if not final_dates:
+            return
+        watermark = self.store.get_watermark(filters)
+        start, end = merge_date_ranges(
+            (watermark.get("start"), watermark.get("watermark")) if watermark else None,
+            (min(self.start_date, min(final_dates)), max(final_dates)),
+        )
+        self.store.set_watermark(filters, start, end)
+
+    def _filters(self) -> dict:
+        """Filter set used to build each request (excluding the iteration value)
+
+        Returns
+        -------
+            dict
+                filter params, used as the cache key
+        """
+        return statcast_filters({arg: getattr(self, arg) for arg in self.CleanupArgs})
+
+    def _build_url(self, iter_val, end_val: str = None) -> str:
         """Build Statcast API Request URL
 
         For each of the main parameters in this class's init --
@@ -202,8 +757,11 @@ class Statcast:
 
         Parameters
         ----------
+            iter_val
                 Value being iterated over for the current iteration
                 i.e. 2023-09-01, 2023-09-02, etc.
+            end_val (str, optional): str, default None
+                Last date of the range (dates only), defaults to iter_val
 
         Returns
         -------
@@ -225,11 +783,21 @@ class Statcast:
                 [f"{x}|".replace(" ", "\\.\\.") for x in self.descriptions]
             )
 
+        if self.innings:
+            base_url += "&hfInn=" + "".join([f"{x}|" for x in self.innings])
+
+        if self.counts:
+            base_url += "&hfC=" + "".join([f"{x}|" for x in self.counts])
+
         if self.iteration_type == "games":
             base_url = base_url + "&game_pk=" + str(iter_val)
         elif self.iteration_type == "dates":
             base_url = (
-                base_url + "&game_date_gt=" + iter_val + "&game_date_lt=" + iter_val
+                base_url
+                + "&game_date_gt="
+                + iter_val
+                + "&game_date_lt="
+                + (end_val if end_val else iter_val)
             )
 
         if self.pitchers:
@@ -239,32 +807,220 @@ class Statcast:
             base_url += "".join([f"&batters_lookup[]={x}" for x in self.batters])
 
         ##Handle teams
-        if (
-            self.iteration_type == "games"
-            or self.pitchers
-            or self.batters
-            and self.teams
+        if self.teams and (
+            self.iteration_type == "games" or self.pitchers or self.batters
         ):
             logging.warning(
                 f"Team parameter passed, but game, pitcher or batter already specified.. Not applying team filter."
             )
         elif self.teams:
-            (
-                base_url
-                + "&player_type=pitcher|batter|&hfTeam="
-                + "".join([f"{x}|" for x in self.teams])
+            base_url += "&player_type=pitcher|batter|&hfTeam=" + "".join(
+                [f"{x}|" for x in self.teams]
             )
 
         return base_url
 
-    def _make_request(self, iter_val: str) -> pd.DataFrame:
+    def _plan_chunks(self) -> list:
+        """Plan Chunks
+
+        When iterating by dates, groups consecutive dates into the largest ranges
+        expected to stay under Savant's row cap, based on the selectivity of the filters
+
+        Returns
+        -------
+            list
+                list of chunks (list of iteration values)
+        """
+        if self.iteration_type != "dates" or not self.chunking:
+            return [[iter_val] for iter_val in self.iterations]
+        rows_per_day = estimate_rows_per_day(self._filters())
+        days = chunk_days(rows_per_day)
+        chunks = plan_chunks(self.iterations, days)
+        logging.info(
+            f"Planned {len(chunks)} request(s) for {len(self.iterations)} date(s), "
+            f"~{rows_per_day:.0f} rows/day, up to {days} day(s) per request."
+        )
+        return chunks
+
+    def _make_request(self, chunk: list) -> pd.DataFrame:
         """Make Request to Statcast API
 
+        Checks the local store/cache first for each iteration value in the chunk,
+        only requesting the missing (consecutive) ranges from the API.
+        Finalized results are written back to the cache, and to the store if save_local.
+        A failed range is logged & recorded in self.errors, the rest of the chunk is kept.
+
+        Parameters
+        ----------
+            chunk : list
+                Values being iterated over for the current iteration
+                i.e. [2023-09-01, 2023-09-02, etc.]
+
+        Returns
+        -------
+            pd.DataFrame
+                Dataframe for the iteration (without any failed values)
+        """
+        results = {}
+        pending = []
+        for iter_val in chunk:
+            df = self._load_local(iter_val)
+            if df is not None:
+                results[iter_val] = df
+            else:
+                pending.append(iter_val)
+
+        if self.iteration_type == "dates":
+            ranges = plan_chunks(pending, len(pending)) if pending else []
+        else:
+            ranges = [[iter_val] for iter_val in pending]
+        for rng in ranges:
+            try:
+                fetched = self._fetch_range(rng)
+            except Exception as e:
+                self._record_error(rng, e)
+                continue
+            for iter_val, df in fetched.items():
+                self._save_local(iter_val, df)
+                results[iter_val] = self._project(df)
+
+        dfs = [results.get(iter_val) for iter_val in chunk if iter_val in results]
+        if not dfs:
+            return pd.DataFrame()
+        return pd.concat(dfs, axis=0, ignore_index=True)
+
+    def _record_error(self, iter_vals: list, e: Exception) -> None:
+        """Record failed iteration values
+
+        Parameters
+        ----------
+            iter_vals : list
+                dates or game_pks that failed
+            e : Exception
+                error raised
+        """
+        logging.error(
+            f"Statcast request failed for {iter_vals[0]} - {iter_vals[-1]}: {e}"
+        )
+        for iter_val in iter_vals:
+            self.errors[iter_val] = str(e)
+
+    def _load_local(self, iter_val: str) -> Union[pd.DataFrame, None]:
+        """Load iteration from the local store or cache
+
+        Parameters
+        ----------
+            iter_val : str
+                date or game_pk
+
+        Returns
+        -------
+            Union[pd.DataFrame, None]
+                Dataframe for the iteration, None if not available locally
+        """
+        filters = self._filters()
+        if (
+            self.store
+            and not self.incremental
+            and self.iteration_type == "dates"
+            and self.store.has(filters, iter_val)
+            and is_final_date(iter_val)
+        ):
+            logging.info(f"Loaded stored results for: {iter_val}")
+            return self.store.read(filters, [iter_val], self.columns)
+
+        if iter_val in self.reverify_iterations:
+            return None
+
+        df = self.cache.get(filters, iter_val) if self.cache else None
+        if df is not None:
+            logging.info(f"Loaded cached results for: {iter_val}")
+            if (
+                self.store
+                and self.iteration_type == "dates"
+                and not self.store.has(filters, iter_val)
+            ):
+                self.store.write(filters, df)
+            return self._project(df)
+        return None
+
+    def _save_local(self, iter_val: str, df: pd.DataFrame) -> None:
+        """Save fetched iteration to the cache, and to the store if save_local (final dates)
+
+        Parameters
+        ----------
+            iter_val : str
+                date or game_pk
+            df : pd.DataFrame
+                Dataframe for the iteration
+        """
+        if df is None:
+            return
+        if self.cache:
+            self.cache.put(self._filters(), iter_val, df)
+        # A game's pitches would replace the whole date partition,
+        # dates Savant is still updating are refetched instead of stored
+        if self.store and self.iteration_type == "dates" and is_final_date(iter_val):
+            self.store.write(self._filters(), df)
+
+    def _project(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Project dataframe to self.columns (if any)
+
+        Parameters
+        ----------
+            df : pd.DataFrame
+
+        Returns
+        -------
+            pd.DataFrame
+        """
+        if df is None or not self.columns:
+            return df
+        return df[[c for c in self.columns if c in df.columns]]
+
+    def _fetch_range(self, rng: list) -> dict:
+        """Fetch a range of iteration values from Statcast API
+
+        If the response hits the row cap, it was truncated by Savant --
+        split the range in half & retry each side
+
+        Parameters
+        ----------
+            rng : list
+                consecutive dates, or a single game_pk
+
+        Returns
+        -------
+            dict
+                iteration value -> Dataframe
+        """
+        df = self._fetch(rng[0], rng[-1])
+        if df is not None and len(df) >= _SAVANT_ROW_CAP:
+            if len(rng) > 1:
+                logging.warning(
+                    f"Response truncated at {len(df)} rows for {rng[0]} - {rng[-1]}, "
+                    f"splitting range & retrying.."
+                )
+                mid = len(rng) // 2
+                return {**self._fetch_range(rng[:mid]), **self._fetch_range(rng[mid:])}
+            logging.warning(f"Response truncated at {len(df)} rows for {rng[0]}.")
+
+        if len(rng) == 1:
+            return {rng[0]: df}
+        if df is None or df.empty:
+            return {iter_val: df for iter_val in rng}
+        dates = pd.to_datetime(df["game_date"]).dt.strftime(_DT_FORMAT)
+        return {iter_val: df[dates == iter_val] for iter_val in rng}
+
+    def _fetch(self, iter_val: str, end_val: str = None) -> pd.DataFrame:
+        """Fetch iteration from Statcast API
+
         Parameters
         ----------
             iter_val : str
                 Value being iterated over for the current iteration
-                i.e. 2023-09-01, 2023-09-02, etc.
+            end_val (str, optional): str, default None
+                Last date of the range, if requesting multiple dates
 
         Raises
         ------
@@ -276,35 +1032,209 @@ class Statcast:
             pd.DataFrame
                 Dataframe for the iteration
         """
-        resp = requests.get(self._build_url(iter_val), timeout=_REQUEST_TIMEOUT)
-        logging.info(f"Performed request for: {resp.url}")
-        df = pd.read_csv(io.StringIO(resp.content.decode("utf-8")))
-        df = parse_df(df)
-        if df is not None and not df.empty:
-            if "error" in df.columns:
-                raise Exception(df["error"].values[0])
-            else:
-                df = df.sort_values(_DEFAULT_SORT, ascending=True)
+        batches = list(self._iter_fetch(iter_val, end_val))
+        if not batches:
+            return pd.DataFrame()
+        df = restore_categoricals(pd.concat(batches, axis=0, ignore_index=True))
+        if not df.empty:
+            df = df.sort_values(_DEFAULT_SORT, ascending=True)
         return df
 
+    def _iter_fetch(
+        self, iter_val: str, end_val: str = None, batch_rows: int = _STREAM_BATCH_ROWS
+    ):
+        """Stream iteration from Statcast API
+
+        The CSV is parsed straight from the response byte stream, in batches --
+        the full response text is never held in memory.
+        If the response does not match the declared schema, it is requested again
+        and read with type inference.
+
+        Parameters
+        ----------
+            iter_val : str
+                Value being iterated over for the current iteration
+            end_val (str, optional): str, default None
+                Last date of the range, if requesting multiple dates
+            batch_rows (int, optional): int, default _STREAM_BATCH_ROWS
+                max rows per batch
+
+        Raises
+        ------
+            Exception
+                Can raise exception if the request fails for any reason.
+
+        Yields
+        ------
+            pd.DataFrame
+                parsed batch
+        """
+        url = self._build_url(iter_val, end_val)
+        with get_with_retry(
+            self.session,
+            url,
+            limiter=self.limiter,
+            retries=_REQUEST_RETRIES,
+            timeout=_REQUEST_TIMEOUT,
+            stream=True,
+        ) as resp:
+            logging.info(f"Performed request for: {resp.url}")
+            resp.raw.decode_content = True
+            batches = iter_statcast_csv(resp.raw, batch_rows)
+            try:
+                first = next(batches, None)
+            except pd.errors.EmptyDataError:
+                return
+            except (ValueError, TypeError) as e:
+                logging.warning(
+                    f"Statcast CSV did not match schema, inferring types: {e}"
+                )
+                first = None
+                batches = None
+
+            if batches is not None:
+                if first is not None:
+                    if "error" in first.columns:
+                        raise Exception(first["error"].values[0])
+                    yield first
+                yield from batches
+                return
+
+        resp = get_with_retry(
+            self.session,
+            url,
+            limiter=self.limiter,
+            retries=_REQUEST_RETRIES,
+            timeout=_REQUEST_TIMEOUT,
+        )
+        yield parse_statcast_content(resp.content)
+
     def concurrent_requests(self) -> None:
         """Concurrent Requests -> Statcast API
 
         Based on the iterator used (either day-by-day or game-by-game)
-        Iterate over each value, collect the results
+        Iterate over each chunk of values (up to self.max_workers at once), collect the results
+        in iteration order (completion order if not self.ordered)
+        A chunk that fails is recorded in self.errors instead of stopping the run
         """
+        self._load_synced()
+        chunks = self._plan_chunks()
         logging.info(f"Starting statcast iterations..")
-        with tqdm(total=len(self.iterations)) as progress:
-            with concurrent.futures.ThreadPoolExecutor() as executor:
+        with tqdm(total=len(chunks)) as progress:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.max_workers
+            ) as executor:
                 futures = {
-                    executor.submit(self._make_request, iter_val)
-                    for iter_val in self.iterations
+                    executor.submit(self._make_request, chunk): i
+                    for i, chunk in enumerate(chunks)
                 }
                 for future in concurrent.futures.as_completed(futures):
-                    self.df_list.append(future.result())
+                    try:
+                        self._collect(futures[future], future.result())
+                    except Exception as e:
+                        self._record_error(chunks[futures[future]], e)
                     progress.update(1)
+        self._flush_results()
         logging.info(f"Completed statcast iterations..")
 
+    def _collect(self, i: int, df: pd.DataFrame) -> None:
+        """Collect the result of chunk i
+
+        Kept by chunk index until all chunks complete (see _flush_results),
+        or appended straight to self.df_list if not self.ordered
+        """
+        if self.ordered:
+            self.results[i] = df
+        else:
+            self.df_list.append(df)
+
+    def _flush_results(self) -> None:
+        """Append collected results to self.df_list, in iteration order"""
+        self.df_list.extend(self.results[i] for i in sorted(self.results))
+        self.results = {}
+
+    def _load_synced(self) -> None:
+        """Load dates already synced to the store (incremental mode)"""
+        if self.synced_iterations:
+            self.df_list.append(
+                self.store.read(self._filters(), self.synced_iterations, self.columns)
+            )
+            logging.info(
+                f"Loaded {len(self.synced_iterations)} synced date(s) from store.."
+            )
+
+    def iter_batches(self, batch_rows: int = _STREAM_BATCH_ROWS):
+        """Iterate Batches
+
+        Generator alternative to concurrent_requests/create_df, so downstream stages
+        can start before the whole pull finishes. Local (store/cache) results are
+        yielded per iteration value, single dates/games are streamed from the API
+        in batches. Multi-day ranges are yielded once the range completes,
+        as a truncated response is split & retried first.
+        Failed values are recorded in self.errors (some batches of a single value
+        may already have been yielded) and the iteration continues.
+
+        Parameters
+        ----------
+            batch_rows (int, optional): int, default _STREAM_BATCH_ROWS
+                max rows per streamed batch
+
+        Yields
+        ------
+            pd.DataFrame
+                batch of statcast data (not globally sorted, no pitch_id)
+        """
+        if self.synced_iterations:
+            yield self.store.read(self._filters(), self.synced_iterations, self.columns)
+
+        for chunk in self._plan_chunks():
+            pending = []
+            for iter_val in chunk:
+                df = self._load_local(iter_val)
+                if df is not None and not df.empty:
+                    yield df
+                elif df is None:
+                    pending.append(iter_val)
+
+            if self.iteration_type == "dates":
+                ranges = plan_chunks(pending, len(pending)) if pending else []
+            else:
+                ranges = [[iter_val] for iter_val in pending]
+            for rng in ranges:
+                if len(rng) > 1:
+                    try:
+                        fetched = self._fetch_range(rng)
+                    except Exception as e:
+                        self._record_error(rng, e)
+                        continue
+                    for iter_val, df in fetched.items():
+                        self._save_local(iter_val, df)
+                        if df is not None and not df.empty:
+                            yield self._project(df)
+                    continue
+
+                keep = self.cache is not None or self.store is not None
+                batches = []
+                try:
+                    for batch in self._iter_fetch(rng[0], batch_rows=batch_rows):
+                        if keep:
+                            batches.append(batch)
+                        yield self._project(batch)
+                except Exception as e:
+                    self._record_error(rng, e)
+                    continue
+                if keep:
+                    df = (
+                        restore_categoricals(
+                            pd.concat(batches, axis=0, ignore_index=True)
+                        ).sort_values(_DEFAULT_SORT, ascending=True)
+                        if batches
+                        else pd.DataFrame()
+                    )
+                    self._save_local(rng[0], df)
+
+        self._update_watermark()
+
     def create_df(self) -> None:
         """Create Statcast DataFrame
 
@@ -316,15 +1246,19 @@ class Statcast:
             self.df = pd.concat(self.df_list, axis=0, ignore_index=True).convert_dtypes(
                 convert_string=False
             )
+            self.df = restore_categoricals(self.df)
 
-            self.df = self.df.sort_values(_DEFAULT_SORT, ascending=True)
+            if self.ordered and not is_sorted(self.df):
+                logging.info(f"Partitions out of order, sorting statcast df..")
+                self.df = self.df.sort_values(
+                    _DEFAULT_SORT, ascending=True, ignore_index=True
+                )
 
-            self.df[_UNIQUE_IDENTIFIER_NAME] = self.df.apply(
-                lambda x: _UNIQUE_IDENTIFIER_DELIMITER.join(
-                    [str(x.get(col)) for col in _UNIQUE_IDENTIFIER_COLS]
-                ),
-                axis=1,
-            )
+            self.df[_UNIQUE_IDENTIFIER_NAME] = build_pitch_id(self.df)
+            if self.packed_key:
+                self.df[_PACKED_KEY_NAME] = build_pitch_key(self.df)
+            if self.compact:
+                self.df = compact_df(self.df)
 
     # def save_df(self):
     #     self.df.to_csv(
@@ -1,12 +1,25 @@
 import os
+import json
 import requests
 import pandas as pd
-from tqdm import tqdm
-import concurrent.futures
 from typing import Union
+from datetime import date, datetime
 
-from .constants import Teams
+from .constants import Teams, _DT_FORMAT
 from .utils import yesterday
+from .session import get_session, get_with_retry
+from .executor import FetchExecutor
+from .cache.metadata_cache import (
+    MetadataCache,
+    _FINAL_GAME_TTL,
+    _LIVE_GAME_TTL,
+    _PLAYER_TTL,
+)
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 import logging
 import logging.config
@@ -15,9 +28,15 @@ logger = logging.getLogger(__name__)
 
 _GAME_URL = "https://statsapi.mlb.com/api/v1.1/game/{0}/feed/live"
 _PLAYER_URL = "https://statsapi.mlb.com/api/v1/people/{0}"
+_PEOPLE_URL = "https://statsapi.mlb.com/api/v1/people"
+_MAX_URL_LENGTH = 2000
 _PLAYER_SITE_URL = "https://www.mlb.com/player/{0}"
 _SCHEDULE_URL = "https://statsapi.mlb.com/api/v1/schedule"
-_CONCURRENT_THRESHOLD = 10
+_GAME_BATCH_SIZE = 50
+_GAME_HYDRATE = "venue(timezone),officials,decisions,team"
+_GAME_FINAL_STATE = "Final"
+_GAME_STATE_ROUTE = ["gameData", "status", "abstractGameState"]
+_JSON_SCALAR_EVENTS = ["null", "boolean", "integer", "double", "number", "string"]
 
 _SOCIALS = [
     {"name": "twitter", "repl": "https://twitter.com/@"},
@@ -71,6 +90,26 @@ _GAME_ROUTES = {
         "CustomPath": ["official", "fullName"],
     },
 }
+_SCHEDULE_GAME_ROUTES = {
+    "Info": {"season": ["season"]},
+    "Dates": {
+        "dateTime": ["gameDate"],
+        "officialDate": ["officialDate"],
+        "dayNight": ["dayNight"],
+    },
+    "AwayTeam": {
+        "name": ["teams", "away", "team", "name"],
+        "abbreviation": ["teams", "away", "team", "abbreviation"],
+    },
+    "HomeTeam": {
+        "name": ["teams", "home", "team", "name"],
+        "abbreviation": ["teams", "home", "team", "abbreviation"],
+    },
+    "Venue": {"name": ["venue", "name"]},
+    "Winner": {"id": ["decisions", "winner", "id"]},
+    "Loser": {"id": ["decisions", "loser", "id"]},
+    "Save": {"id": ["decisions", "save", "id"]},
+}
 _PLAYER_FIELDS = [
     "id",
     "fullName",
@@ -90,26 +129,230 @@ _PLAYER_FIELDS = [
 ]
 
 
+def chunk_ids(ids: list, base_length: int, max_length: int = _MAX_URL_LENGTH) -> list:
+    """Chunk IDs
+
+    Splits ids into comma-separated chunks that keep a URL under max_length
+    (commas are URL-encoded, 3 chars each)
+
+    Parameters
+    ----------
+        ids : list
+            list of ids (str)
+        base_length : int
+            length of the URL without the ids
+        max_length (int, optional): int, default _MAX_URL_LENGTH
+            max URL length
+
+    Returns
+    -------
+        list
+            list of chunks (list of ids)
+    """
+    chunks = []
+    length = max_length
+    for i in ids:
+        if chunks and length + 3 + len(i) <= max_length:
+            chunks[-1].append(i)
+            length += 3 + len(i)
+        else:
+            chunks.append([i])
+            length = base_length + len(i)
+    return chunks
+
+
+def current_age(birth_date: str) -> int:
+    """Current Age
+
+    Parameters
+    ----------
+        birth_date : str
+            birth date (i.e. "1994-08-21")
+
+    Returns
+    -------
+        int
+            age in years as of today
+    """
+    born = datetime.strptime(birth_date, _DT_FORMAT).date()
+    today = date.today()
+    return today.year - born.year - ((today.month, today.day) < (born.month, born.day))
+
+
+def game_route_paths() -> set:
+    """Game Route Paths
+
+    Compiles _GAME_ROUTES (plus gamePk & the game state) into the set of
+    dotted paths (ijson prefixes) needed to parse a live feed
+
+    Returns
+    -------
+        set
+            i.e. {"gamePk", "gameData.game", "liveData.boxscore.officials", ..}
+    """
+    routes = [cfg.get("Route") for cfg in _GAME_ROUTES.values()]
+    return {".".join(route) for route in routes + [["gamePk"], _GAME_STATE_ROUTE]}
+
+
+def extract_paths(stream, paths: set) -> dict:
+    """Extract Paths
+
+    Incrementally parses a JSON document, only building the subtrees at paths --
+    everything else (i.e. the liveData.plays arrays of a live feed) is read past
+    without being materialized. Stops reading once every path has been found,
+    or has been ruled out (its parent object ended w/o it, i.e. no save decision)
+
+    Requires ijson
+
+    Parameters
+    ----------
+        stream : file-like
+            binary stream of the JSON document (i.e. response.raw)
+        paths : set
+            dotted paths to extract, see game_route_paths
+
+    Returns
+    -------
+        dict
+            nested dict holding only the extracted paths
+    """
+    data = {}
+    remaining = set(paths)
+    builder, depth, path = None, 0, None
+    for prefix, event, value in ijson.parse(stream, use_float=True):
+        if builder is None:
+            if event == "end_map" and "item" not in prefix.split("."):
+                # Paths under an object that just ended can't appear anymore
+                remaining = {
+                    p for p in remaining if prefix and not p.startswith(f"{prefix}.")
+                }
+                if not remaining:
+                    break
+                continue
+            if prefix not in remaining or event in ["map_key", "end_array"]:
+                continue
+            path = prefix
+            if event in _JSON_SCALAR_EVENTS:
+                result = value
+            else:
+                builder, depth = ijson.ObjectBuilder(), 0
+        if builder is not None:
+            builder.event(event, value)
+            if event in ["start_map", "start_array"]:
+                depth += 1
+            elif event in ["end_map", "end_array"]:
+                depth -= 1
+            if depth:
+                continue
+            result, builder = builder.value, None
+
+        *parents, key = path.split(".")
+        node = data
+        for parent in parents:
+            node = node.setdefault(parent, {})
+        node[key] = result
+        remaining.discard(path)
+        if not remaining:
+            break
+    return data
+
+
 class Game:
     """Game Endpoint for MLB Stats API"""
 
-    def __init__(self, game_pks: list):
+    def __init__(
+        self,
+        game_pks: list,
+        session: requests.Session = None,
+        batched: bool = True,
+        executor: FetchExecutor = None,
+        use_cache: bool = True,
+        streaming: bool = True,
+    ):
         """_summary_
 
         Parameters
         ----------
             game_pks : list
                 list of game IDs to query information for
+            session (requests.Session, optional): requests.Session, default None
+                HTTP session to use, defaults to the shared pooled session
+            batched (bool, optional): bool, default True
+                Request up to _GAME_BATCH_SIZE games per request from the schedule
+                endpoint (hydrated), instead of the full live feed of each game
+                Games the schedule can't provide fall back to the live feed
+            executor (FetchExecutor, optional): FetchExecutor, default None
+                Runs the requests (serial, threads or async, based on the count)
+                Games that fail are logged & kept in self.errors
+            use_cache (bool, optional): bool, default True
+                Serve games from the local metadata cache -- final games are kept
+                for _FINAL_GAME_TTL, games in progress for _LIVE_GAME_TTL
+            streaming (bool, optional): bool, default True
+                When the live feed is needed, parse it incrementally & only build
+                the _GAME_ROUTES subtrees (skips liveData.plays) -- requires ijson,
+                otherwise the full feed is parsed
         """
+        self.session = session if session else get_session()
+        self.executor = executor if executor else FetchExecutor(self.session)
+        self.errors = self.executor.errors
+        self.cache = MetadataCache() if use_cache else None
+        self.streaming = streaming and ijson is not None
         self.game_list = list(set(int(gpk) for gpk in game_pks))
         self.df_list = []
+        self.fetched = {}
         self.df = None
-        if len(self.df_list) >= _CONCURRENT_THRESHOLD:
-            self.get_games_concurrent()
-        else:
-            self.get_games()
+        pending = self._load_cached()
+        if pending and batched:
+            self.get_games_batched(pending)
+        elif pending:
+            self.get_games(pending)
+        self._cache_games()
         self.create_df()
 
+    def _load_cached(self) -> list:
+        """Load cached games (one bulk lookup)
+
+        Returns
+        -------
+            list
+                game pks not in the cache
+        """
+        if not self.cache:
+            return self.game_list
+        cached = self.cache.get_many("game", self.game_list)
+        self.df_list.extend(pd.DataFrame(records) for records in cached.values())
+        return [gpk for gpk in self.game_list if str(gpk) not in cached]
+
+    def _add_game(self, game_pk: int, df: pd.DataFrame, state: str) -> None:
+        """Add a fetched game
+
+        Parameters
+        ----------
+            game_pk : int
+                game pk
+            df : pd.DataFrame
+                parsed game (single row)
+            state : str
+                abstract game state (i.e. Final, Live, Preview)
+        """
+        self.df_list.append(df)
+        self.fetched[game_pk] = (df, state == _GAME_FINAL_STATE)
+
+    def _cache_games(self) -> None:
+        """Write fetched games to the cache (TTL by game state)"""
+        if not self.cache:
+            return
+        for final, ttl in [(True, _FINAL_GAME_TTL), (False, _LIVE_GAME_TTL)]:
+            self.cache.put_many(
+                "game",
+                {
+                    gpk: json.loads(df.to_json(orient="records"))
+                    for gpk, (df, is_final) in self.fetched.items()
+                    if is_final == final
+                },
+                ttl,
+            )
+
     def _make_api_request(self, game_id):
         """MLBStatsAPI | Game Endpoint to DF
 
@@ -123,29 +366,177 @@ class Game:
             df
                 pd.DataFrame with game datapoints
         """
-        resp = requests.get(_GAME_URL.format(game_id))
+        if self.streaming:
+            return self.parse_response(self._get_game_streaming(game_id))
+        resp = get_with_retry(
+            self.session, _GAME_URL.format(game_id), limiter=self.executor.limiter
+        )
         df = self.parse_response(resp.json())
         return df
 
-    def get_games(self):
-        """Loop to get all game data"""
-        for game in self.game_list:
-            self.df_list.append(self._make_api_request(game))
+    def _get_game_streaming(self, game_id: int) -> dict:
+        """Live feed for a game, reduced to the _GAME_ROUTES subtrees
+
+        Parameters
+        ----------
+            game_id : int
+                game pk
+
+        Returns
+        -------
+            dict
+                partial live feed, see extract_paths
+        """
+        with get_with_retry(
+            self.session,
+            _GAME_URL.format(game_id),
+            limiter=self.executor.limiter,
+            stream=True,
+        ) as resp:
+            resp.raw.decode_content = True
+            return extract_paths(resp.raw, game_route_paths())
+
+    def get_games(self, game_list: list = None):
+        """Get all game data from the live feed
+
+        Parameters
+        ----------
+            game_list (list, optional): list, default None
+                game pks, defaults to self.game_list
+        """
+        game_list = game_list if game_list is not None else self.game_list
+        if self.streaming:
+            results = self.executor.map(self._get_game_streaming, game_list)
+        else:
+            results = self.executor.get_json(
+                {gpk: (_GAME_URL.format(gpk), None) for gpk in game_list}
+            )
+        for gpk, data in results.items():
+            self._add_game(
+                gpk,
+                self.parse_response(data),
+                data.get("gameData", {}).get("status", {}).get("abstractGameState"),
+            )
+
+    def get_games_batched(self, game_list: list = None):
+        """Get game data in batches from the (hydrated) schedule endpoint
+
+        Falls back to the live feed for any game not returned,
+        or missing a field only the live feed has (local start time)
+
+        Parameters
+        ----------
+            game_list (list, optional): list, default None
+                game pks, defaults to self.game_list
+        """
+        game_list = game_list if game_list is not None else self.game_list
+        batches = [
+            game_list[i : i + _GAME_BATCH_SIZE]
+            for i in range(0, len(game_list), _GAME_BATCH_SIZE)
+        ]
+        results = self.executor.get_json(
+            {
+                i: (
+                    _SCHEDULE_URL,
+                    {
+                        "gamePks": ",".join(str(gpk) for gpk in batch),
+                        "hydrate": _GAME_HYDRATE,
+                    },
+                )
+                for i, batch in enumerate(batches)
+            }
+        )
+        missing = []
+        for i, batch in enumerate(batches):
+            # postponed/suspended games are listed again on the new date, keep the last
+            games = {
+                game.get("gamePk"): game
+                for dates in results.get(i, {}).get("dates", [])
+                for game in dates.get("games", [])
+            }
+            for gpk in batch:
+                data = (
+                    self.parse_schedule_game(games.get(gpk)) if gpk in games else None
+                )
+                if data is None:
+                    missing.append(gpk)
+                else:
+                    self._add_game(
+                        gpk,
+                        data,
+                        games.get(gpk).get("status", {}).get("abstractGameState"),
+                    )
+        logging.info(
+            f"Got {len(game_list) - len(missing)} game(s) from schedule, "
+            f"{len(missing)} from live feed.."
+        )
+        if missing:
+            self.get_games(missing)
+
+    def parse_schedule_game(self, game: dict) -> pd.DataFrame:
+        """Parse a game from the hydrated schedule endpoint
+
+        Returns the same columns as parse_response (live feed)
+
+        Parameters
+        ----------
+            game : dict
+                game element of the schedule response
+
+        Returns
+        -------
+            pd.DataFrame
+                single row df, None if the game is missing fields (use the live feed)
+        """
+        df = {"game_pk": game.get("gamePk")}
+        for name, cfg in _SCHEDULE_GAME_ROUTES.items():
+            d = {}
+            for col, route in cfg.items():
+                value = game
+                for key in route:
+                    value = value.get(key) if isinstance(value, dict) else None
+                if value is not None:
+                    d[col] = value
+            if d:
+                df[name] = d
+
+        try:
+            local_dt = pd.Timestamp(game.get("gameDate")).tz_convert(
+                game.get("venue").get("timeZone").get("id")
+            )
+        except (AttributeError, KeyError, ValueError, TypeError):
+            return None
+        df.setdefault("Dates", {})
+        df["Dates"]["time"] = f"{local_dt.hour % 12 or 12}:{local_dt.minute:02d}"
+        df["Dates"]["ampm"] = "AM" if local_dt.hour < 12 else "PM"
+
+        officials = {
+            o.get("officialType"): o.get("official", {}).get("fullName")
+            for o in game.get("officials", [])
+        }
+        umpires = {
+            col: officials.get(col)
+            for col in _GAME_ROUTES.get("Umpires").get("Columns")
+            if col in officials
+        }
+        if umpires:
+            df["Umpires"] = umpires
+
+        df = pd.json_normalize(df, sep="_")
+        df = df.rename(
+            columns={c: c.replace(" ", "_").lower() for c in df.columns.values}
+        )
+        return df
 
     def get_games_concurrent(self):
-        """Concurrent API requests w/ MLB Stats API"""
-        with tqdm(total=len(self.game_list)) as progress:
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                futures = {
-                    executor.submit(self._make_api_request, game_id)
-                    for game_id in self.game_list
-                }
-                for future in concurrent.futures.as_completed(futures):
-                    self.df_list.append(future.result())
-                    progress.update(1)
+        """Concurrent API requests w/ MLB Stats API (see get_games, FetchExecutor)"""
+        self.get_games()
 
     def create_df(self):
         """Create consolidated DF from list of reqs"""
+        if not self.df_list:
+            self.df = pd.DataFrame(columns=["game_pk"])
+            return
         self.df = pd.concat(self.df_list, axis=0, ignore_index=True)
         self.df = self.df.sort_values("game_pk", ascending=True)
 
@@ -236,26 +627,82 @@ class Game:
 class Player:
     """Player Data for MLB (API)"""
 
-    def __init__(self, player_id: Union[int, list]):
+    def __init__(
+        self,
+        player_id: Union[int, list],
+        session: requests.Session = None,
+        batched: bool = True,
+        executor: FetchExecutor = None,
+        use_cache: bool = True,
+    ):
         """_summary_
 
         Parameters
         ----------
             player_id : Union[int, list]
                 player id
+            session (requests.Session, optional): requests.Session, default None
+                HTTP session to use, defaults to the shared pooled session
+            batched (bool, optional): bool, default True
+                Request many players per request (personIds), chunked to keep
+                URLs under _MAX_URL_LENGTH
+            executor (FetchExecutor, optional): FetchExecutor, default None
+                Runs the requests (serial, threads or async, based on the count)
+                Requests that fail are logged & kept in self.errors
+            use_cache (bool, optional): bool, default True
+                Serve players from the local metadata cache (for _PLAYER_TTL),
+                currentAge is recomputed from the cached birthDate
         """
+        self.session = session if session else get_session()
+        self.executor = executor if executor else FetchExecutor(self.session)
+        self.errors = self.executor.errors
+        self.cache = MetadataCache() if use_cache else None
         if isinstance(player_id, int):
             self.player_list = [player_id]
         else:
             self.player_list = player_id
         self.df_list = []
+        self.fetched = {}
         self.df = None
-        if len(self.player_list) >= _CONCURRENT_THRESHOLD:
-            self.get_players_concurrent()
-        else:
-            self.get_players()
+        pending = self._load_cached()
+        if pending and batched:
+            self.get_players_batched(pending)
+        elif pending:
+            self.get_players(pending)
+        if self.cache:
+            self.cache.put_many("player", self.fetched, _PLAYER_TTL)
         self.create_df()
 
+    def _load_cached(self) -> list:
+        """Load cached players (one bulk lookup)
+
+        Returns
+        -------
+            list
+                player ids not in the cache
+        """
+        if not self.cache:
+            return self.player_list
+        cached = self.cache.get_many("player", self.player_list)
+        for person in cached.values():
+            if person.get("birthDate"):
+                person["currentAge"] = current_age(person.get("birthDate"))
+            self.df_list.append(self._parse_person(person))
+        return [p for p in self.player_list if str(p) not in cached]
+
+    def _add_person(self, person: dict) -> None:
+        """Add a fetched person (kept w/ birthDate for the cache)
+
+        Parameters
+        ----------
+            person : dict
+                person element of the people response
+        """
+        self.df_list.append(self._parse_person(person))
+        self.fetched[person.get("id")] = {
+            k: v for k, v in person.items() if k in _PLAYER_FIELDS + ["birthDate"]
+        }
+
     def _parse_response(self, data: dict) -> None:
         """Parse Response from API
 
@@ -269,7 +716,21 @@ class Player:
             _type_
                 Cleaned data response
         """
-        data = data.get("people")[0]
+        return self._parse_person(data.get("people")[0])
+
+    def _parse_person(self, data: dict) -> pd.DataFrame:
+        """Parse a single person, projected to _PLAYER_FIELDS
+
+        Parameters
+        ----------
+            data : dict
+                person element of the people response
+
+        Returns
+        -------
+            pd.DataFrame
+                single row df
+        """
         data = {k: v for k, v in data.items() if k in _PLAYER_FIELDS}
         df = pd.json_normalize(data, sep="_")
         df = df.rename(
@@ -290,29 +751,63 @@ class Player:
             df
                 pd.DataFrame with parsed reply data
         """
-        resp = requests.get(_PLAYER_URL.format(player_id))
+        resp = get_with_retry(
+            self.session, _PLAYER_URL.format(player_id), limiter=self.executor.limiter
+        )
         df = self._parse_response(resp.json())
         return df
 
-    def get_players(self):
-        """Iterative loop to get all player info"""
-        for player in self.player_list:
-            self.df_list.append(self._make_api_request(player_id=player))
+    def get_players(self, player_list: list = None):
+        """Get all player info, one request per player
+
+        Parameters
+        ----------
+            player_list (list, optional): list, default None
+                player ids, defaults to self.player_list
+        """
+        player_list = player_list if player_list is not None else self.player_list
+        results = self.executor.get_json(
+            {player: (_PLAYER_URL.format(player), None) for player in player_list}
+        )
+        for data in results.values():
+            self._add_person(data.get("people")[0])
+
+    def get_players_batched(self, player_list: list = None):
+        """Get player info w/ multi-person requests (personIds)
+
+        Parameters
+        ----------
+            player_list (list, optional): list, default None
+                player ids, defaults to self.player_list
+        """
+        player_list = player_list if player_list is not None else self.player_list
+        player_ids = [str(p) for p in dict.fromkeys(player_list)]
+        batches = chunk_ids(player_ids, len(_PEOPLE_URL) + len("?personIds="))
+        results = self.executor.get_json(
+            {
+                i: (_PEOPLE_URL, {"personIds": ",".join(batch)})
+                for i, batch in enumerate(batches)
+            }
+        )
+        for i, data in results.items():
+            people = data.get("people", [])
+            for person in people:
+                self._add_person(person)
+            if len(people) < len(batches[i]):
+                found = [str(person.get("id")) for person in people]
+                logging.warning(
+                    f"No player info for: {[p for p in batches[i] if p not in found]}"
+                )
 
     def get_players_concurrent(self):
-        """Concurrently request player info from API"""
-        with tqdm(total=len(self.player_list)) as progress:
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                futures = {
-                    executor.submit(self._make_api_request, player_id)
-                    for player_id in self.player_list
-                }
-                for future in concurrent.futures.as_completed(futures):
-                    self.df_list.append(future.result())
-                    progress.update(1)
+        """Concurrently request player info from API (see get_players, FetchExecutor)"""
+        self.get_players()
 
     def create_df(self):
         """Create consolidated DF from list of reqs"""
+        if not self.df_list:
+            self.df = pd.DataFrame(columns=["id"])
+            return
         self.df = pd.concat(self.df_list, axis=0, ignore_index=True)
         self.df = self.df.sort_values("id", ascending=True)
 
@@ -330,7 +825,13 @@ class Player:
 class Schedule:
     """MLB Stats API - Schedule Endpoint"""
 
-    def __init__(self, start_date: str, end_date: str = None, team: str = None):
+    def __init__(
+        self,
+        start_date: str,
+        end_date: str = None,
+        team: str = None,
+        session: requests.Session = None,
+    ):
         """Initialize Schedule Endpoint
 
         Parameters
@@ -341,7 +842,10 @@ class Schedule:
                 end date str ("2023-09-01")
             team (str, optional): str, default None
                 abbreviated team name (i.e. SF)
+            session (requests.Session, optional): requests.Session, default None
+                HTTP session to use, defaults to the shared pooled session
         """
+        self.session = session if session else get_session()
         self.start_date = start_date
         self.end_date = end_date if end_date else yesterday()
         self.team = team
@@ -353,7 +857,8 @@ class Schedule:
 
     def _make_request(self):
         """Perform request to Schedule endpoint"""
-        resp = requests.get(
+        resp = get_with_retry(
+            self.session,
             _SCHEDULE_URL,
             params={
                 "sportId": 1,
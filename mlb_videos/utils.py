@@ -230,6 +230,65 @@ def get_date_range(start_dt: str, end_dt: str) -> list:
     return dates
 
 
+def split_date_range(dates: list, watermark: dict, reverify_days: int = 0) -> tuple:
+    """Split Date Range on Watermark
+
+    Dates within the synced range (start through watermark - reverify_days)
+    are considered synced, everything else must be (re)fetched
+
+    Parameters
+    ----------
+        dates : list
+            list of dates (str), i.e. result of get_date_range
+        watermark : dict
+            synced range {"start": str, "watermark": str}, None if never synced
+        reverify_days (int, optional): int, default 0
+            trailing days before the watermark to fetch again
+
+    Returns
+    -------
+        tuple
+            (synced dates, pending dates)
+    """
+    if not watermark:
+        return [], list(dates)
+    cutoff = (
+        datetime.strptime(watermark.get("watermark"), _DT_FORMAT).date()
+        - timedelta(days=reverify_days)
+    ).strftime(_DT_FORMAT)
+    synced = [d for d in dates if watermark.get("start") <= d <= cutoff]
+    return synced, [d for d in dates if d not in set(synced)]
+
+
+def merge_date_ranges(a: tuple, b: tuple) -> tuple:
+    """Merge Date Ranges
+
+    Merges two (start, end) date ranges if they overlap or are adjacent,
+    otherwise keeps the later of the two
+
+    Parameters
+    ----------
+        a : tuple
+            (start, end) dates (str), or None
+        b : tuple
+            (start, end) dates (str), or None
+
+    Returns
+    -------
+        tuple
+            (start, end) dates (str)
+    """
+    if not a or not b:
+        return a or b
+    first, second = sorted([a, b])
+    next_day = (
+        datetime.strptime(first[1], _DT_FORMAT).date() + timedelta(days=1)
+    ).strftime(_DT_FORMAT)
+    if second[0] <= next_day:
+        return (first[0], max(first[1], second[1]))
+    return second
+
+
 def get_video_info(path: str):
     """Uses FFMPEG library to obtain video metadata
 